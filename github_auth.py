@@ -0,0 +1,102 @@
+# github_auth.py
+# Several personal access tokens multiply the hourly REST and GraphQL quota.
+import os
+import threading
+import time
+from github import Auth, Github
+from github.Requester import HTTPSRequestsConnectionClass
+
+# Keep-alive connections to api.github.com, sized for the thread pools that share one client
+# (RepoAnalyzer's sub-analyses plus their file fetches); requests' default of 10 drops the excess
+CONNECTION_POOL_SIZE = 20
+
+# PyGithub spaces every non-GET request a second apart to protect mutations, but this tool never
+# mutates: its POSTs are GraphQL queries, so they only get the ordinary read spacing
+SECONDS_BETWEEN_WRITES = None
+
+# Rate-limit buckets a token is skipped for once spent; search's per-minute bucket refills too fast to matter
+_TRACKED_RESOURCES = ("core", "graphql")
+
+class TokenPoolAuth(Auth.Auth):
+    """
+    Sends each request with the token that has the most quota left.
+
+    Quotas come from the X-RateLimit-* headers of each token's responses; a
+    token with an empty bucket is skipped until its reset time, and requests
+    wait only once every token is spent.
+    """
+
+    def __init__(self, tokens):
+        self._tokens = list(tokens)
+        # token -> {resource: (remaining, reset epoch)}, filled in as responses arrive
+        self._quotas = {token: {} for token in self._tokens}
+        self._lock = threading.Lock()
+
+    @property
+    def token_type(self):
+        return "token"
+
+    @property
+    def token(self):
+        while True:
+            with self._lock:
+                now = time.time()
+                remaining = {token: self._remaining(token, now) for token in self._tokens}
+                available = [token for token in self._tokens if remaining[token] != 0]
+                if available:
+                    # Tokens no response has reported on yet count as full
+                    return max(available, key=lambda token: float("inf") if remaining[token] is None else remaining[token])
+                wait = min(reset for quotas in self._quotas.values() for left, reset in quotas.values() if left == 0 and reset > now) - now
+            time.sleep(wait + 1)
+
+    def _remaining(self, token, now):
+        readings = [left for left, reset in self._quotas[token].values() if reset > now]
+        return min(readings) if readings else None
+
+    def record_response(self, response, *args, **kwargs):
+        headers = response.headers
+        if headers.get("X-RateLimit-Resource", "core") not in _TRACKED_RESOURCES or "X-RateLimit-Remaining" not in headers:
+            return
+        token = response.request.headers.get("Authorization", "").partition(" ")[2]
+        if token not in self._quotas:
+            return
+        quota = (int(float(headers["X-RateLimit-Remaining"])), int(float(headers.get("X-RateLimit-Reset", 0))))
+        with self._lock:
+            self._quotas[token][headers.get("X-RateLimit-Resource", "core")] = quota
+
+    def connection_class(self):
+        auth = self
+
+        class QuotaTrackingConnection(HTTPSRequestsConnectionClass):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.session.hooks["response"].append(auth.record_response)
+
+        return QuotaTrackingConnection
+
+    @property
+    def _masked_token(self):
+        return "token (removed)"
+
+def github_tokens():
+    # GITHUB_TOKENS takes a comma-separated list; GITHUB_TOKEN remains the single-token setting
+    tokens = [token.strip() for token in os.getenv('GITHUB_TOKENS', '').split(',') if token.strip()]
+    if not tokens and os.getenv('GITHUB_TOKEN'):
+        tokens = [os.getenv('GITHUB_TOKEN')]
+    return tokens
+
+def create_github_client(**kwargs):
+    kwargs.setdefault('pool_size', CONNECTION_POOL_SIZE)
+    kwargs.setdefault('seconds_between_writes', SECONDS_BETWEEN_WRITES)
+    tokens = github_tokens()
+    if len(tokens) > 1:
+        auth = TokenPoolAuth(tokens)
+        client = Github(auth=auth, **kwargs)
+        # PyGithub exposes no response hook, so this client's requester gets a connection class that reports
+        # each response to the pool (Requester.injectConnectionClasses would also turn off keep-alive).
+        # Without that, every token would look full forever, so a renamed attribute has to fail loudly
+        if not hasattr(client.requester, "_Requester__connectionClass"):
+            raise RuntimeError("Unsupported PyGithub version: cannot track per-token rate limits for GITHUB_TOKENS")
+        client.requester._Requester__connectionClass = auth.connection_class()
+        return client
+    return Github(auth=Auth.Token(tokens[0]) if tokens else None, **kwargs)
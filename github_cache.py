@@ -0,0 +1,181 @@
+# github_cache.py
+import gzip
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import namedtuple
+from github import GithubException, UnknownObjectException
+from github.GithubObject import CompletableGithubObject, GithubObject
+from github.Issue import Issue
+from github.PaginatedList import PaginatedList
+from itertools import islice
+
+DEFAULT_TTL = 15 * 60  # seconds
+
+# Marker stored for paths that returned 404, so missing files are not re-probed
+_MISSING = "__missing__"
+
+TreeEntry = namedtuple("TreeEntry", ["path", "type", "sha"])
+_TREE_ENTRY_TYPES = {"dir": "tree", "submodule": "commit"}
+
+class GitHubApiCache:
+    """
+    TTL cache for PyGithub lookups, keyed by (repo.full_name, endpoint, path).
+
+    Entries are kept in memory and, when cache_dir is set, persisted as gzipped
+    pickles so later runs can reuse them. Expired single objects that carry an
+    ETag are revalidated with a conditional request instead of being refetched.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, cache_dir=None):
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, repo, endpoint, path, fetch):
+        key = (repo.full_name, endpoint, path)
+        entry = self._lookup(key, repo.requester)
+
+        if entry is not None:
+            if time.time() - entry["timestamp"] < entry["ttl"]:
+                return entry["data"]
+            if entry["etag"] and isinstance(entry["data"], CompletableGithubObject):
+                # update() sends If-None-Match and only downloads the body on change
+                try:
+                    entry["data"].update()
+                    return self._store(key, entry["data"])
+                except GithubException:
+                    pass
+
+        try:
+            data = fetch()
+        except GithubException as e:
+            if e.status == 404:
+                self._store(key, _MISSING)
+            raise
+        return self._store(key, data)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key, requester):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self.cache_dir:
+            entry = self._read_disk(key, requester)
+            if entry is not None:
+                with self._lock:
+                    self._entries[key] = entry
+        if entry is not None and _is_missing(entry["data"]) and time.time() - entry["timestamp"] < entry["ttl"]:
+            raise UnknownObjectException(404, None, None)
+        return entry
+
+    def _store(self, key, data):
+        entry = {
+            "data": data,
+            "timestamp": time.time(),
+            "ttl": self.ttl,
+            "etag": data.etag if isinstance(data, GithubObject) else None,
+        }
+        with self._lock:
+            self._entries[key] = entry
+        if self.cache_dir:
+            self._write_disk(key, entry)
+        return data
+
+    def _disk_path(self, key):
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pkl.gz")
+
+    def _read_disk(self, key, requester):
+        # Pickles written before a PyGithub upgrade can name classes or attributes that no longer exist
+        try:
+            with gzip.open(self._disk_path(key), "rb") as f:
+                entry = pickle.load(f)
+            entry["data"] = _thaw(entry["data"], requester)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+            return None
+        return entry
+
+    def _write_disk(self, key, entry):
+        frozen = dict(entry, data=_freeze(entry["data"]))
+        tmp_path = f"{self._disk_path(key)}.{threading.get_ident()}.tmp"
+        # The data is already fetched, so a read-only or full cache directory only costs the next run a refetch
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with gzip.open(tmp_path, "wb") as f:
+                pickle.dump(frozen, f)
+            os.replace(tmp_path, self._disk_path(key))
+        except (OSError, pickle.PicklingError, TypeError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def _is_missing(data):
+    return isinstance(data, str) and data == _MISSING
+
+def _freeze(data):
+    # PyGithub objects hold a live requester, so only their raw payload is pickled
+    if isinstance(data, GithubObject):
+        return ("github_object", type(data), data.raw_headers, data.raw_data)
+    if isinstance(data, list):
+        return [_freeze(item) for item in data]
+    return data
+
+def _thaw(data, requester):
+    if isinstance(data, tuple) and len(data) == 4 and data[0] == "github_object":
+        _, klass, headers, raw_data = data
+        if issubclass(klass, CompletableGithubObject):
+            return klass(requester, headers, raw_data, completed=True)
+        return klass(requester, headers, raw_data)
+    if isinstance(data, list):
+        return [_thaw(item, requester) for item in data]
+    return data
+
+# Shared cache; set ISSUE_CONTRIBUTOR_CACHE_DIR (e.g. ~/.issue-contributor-cache) to persist it across runs
+_cache_dir = os.getenv("ISSUE_CONTRIBUTOR_CACHE_DIR")
+api_cache = GitHubApiCache(cache_dir=os.path.expanduser(_cache_dir) if _cache_dir else None)
+
+def cached_get_contents(repo, path):
+    return api_cache.get(repo, "contents", path, lambda: repo.get_contents(path))
+
+def cached_get_comments(repo, issue):
+    return api_cache.get(repo, "comments", issue.number, lambda: list(issue.get_comments()))
+
+def cached_get_git_tree(repo):
+    # One recursive tree listing replaces a get_contents call per directory. GitHub cuts the
+    # listing short for very large repositories; None then tells callers to list directories instead
+    def fetch():
+        tree = repo.get_git_tree(repo.default_branch, recursive=True)
+        return None if tree.truncated else tree.tree
+    return api_cache.get(repo, "git_tree", repo.default_branch, fetch)
+
+def cached_list_directory(repo, path):
+    # A get_contents directory listing as git tree entries, for use when the recursive tree is truncated
+    try:
+        contents = cached_get_contents(repo, path)
+    except GithubException:
+        return []
+    if not isinstance(contents, list):
+        return []
+    return [TreeEntry(content.path, _TREE_ENTRY_TYPES.get(content.type, "blob"), content.sha) for content in contents]
+
+def cached_search_count(repo, qualifiers):
+    # total_count is exact, while paginating search results stops at 1000
+    def fetch():
+        _, data = repo.requester.requestJsonAndCheck(
+            "GET", "/search/issues", parameters={"q": f"repo:{repo.full_name} {qualifiers}", "per_page": 1}
+        )
+        return data["total_count"]
+    return api_cache.get(repo, "search/issues/count", qualifiers, fetch)
+
+def cached_search_issues(repo, query, limit=50):
+    def fetch():
+        results = PaginatedList(Issue, repo.requester, "/search/issues", {"q": query, "per_page": limit})
+        return list(islice(results, limit))
+    return api_cache.get(repo, "search/issues", (query, limit), fetch)
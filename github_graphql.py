@@ -0,0 +1,187 @@
+# github_graphql.py
+# GraphQL lets one POST replace a REST call per comment page, label list and file.
+# It requires an authenticated token; callers fall back to REST on GithubException.
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice, takewhile
+
+# Listings fetched side by side when building the repository snapshot
+SNAPSHOT_WORKERS = 4
+
+# Aliased object(expression:) lookups per query, to stay well inside GitHub's query limits
+BLOB_BATCH_SIZE = 50
+
+ISSUE_BUNDLE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      body
+      labels(first: 100) { nodes { name } }
+      comments(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { body }
+      }
+    }
+  }
+}
+"""
+
+def run_query(repo, query, variables):
+    owner, name = repo.full_name.split('/', 1)
+    _, data = repo.requester.graphql_query(query, {"owner": owner, "name": name, **variables})
+    return data["data"]["repository"]
+
+def gql_fetch_issue_bundle(repo, issue_number):
+    """Fetch an issue's body, label names and all comment bodies."""
+    bundle = {"body": "", "labels": [], "comments": []}
+    cursor = None
+    while True:
+        issue = run_query(repo, ISSUE_BUNDLE_QUERY, {"number": issue_number, "cursor": cursor})["issue"]
+        bundle["body"] = issue["body"] or ''
+        bundle["labels"] = [label["name"] for label in issue["labels"]["nodes"]]
+        bundle["comments"].extend(comment["body"] or '' for comment in issue["comments"]["nodes"])
+        page_info = issue["comments"]["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return bundle
+        cursor = page_info["endCursor"]
+
+def gql_fetch_blobs(repo, file_paths, ref="HEAD", max_size=None):
+    """
+    Fetch several files in one query per batch.
+    Returns {path: text} for paths that exist; text is None for binary files
+    and for files larger than max_size bytes.
+    """
+    file_paths = list(file_paths)
+    blobs = {}
+    for start in range(0, len(file_paths), BLOB_BATCH_SIZE):
+        batch = file_paths[start:start + BLOB_BATCH_SIZE]
+        params = ", ".join(f"$f{i}: String!" for i in range(len(batch)))
+        fields = "\n".join(f"f{i}: object(expression: $f{i}) {{ ... on Blob {{ text isBinary byteSize }} }}" for i in range(len(batch)))
+        query = f"query($owner: String!, $name: String!, {params}) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        result = run_query(repo, query, {f"f{i}": f"{ref}:{path}" for i, path in enumerate(batch)})
+        for i, path in enumerate(batch):
+            blob = result[f"f{i}"]
+            # Directories resolve to a Tree and come back as an empty object
+            if blob and "isBinary" in blob:
+                too_large = max_size is not None and blob["byteSize"] > max_size
+                blobs[path] = None if blob["isBinary"] or too_large else blob["text"]
+    return blobs
+
+REPO_OVERVIEW_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: "HEAD:") { ... on Tree { entries { name type } } }
+    workflows: object(expression: "HEAD:.github/workflows") { ... on Tree { entries { name } } }
+    openIssues: issues(states: OPEN) { totalCount }
+    closedIssues: issues(states: CLOSED) { totalCount }
+    openPullRequests: pullRequests(states: OPEN) { totalCount }
+    closedPullRequests: pullRequests(states: CLOSED) { totalCount }
+    mergedPullRequests: pullRequests(states: MERGED) { totalCount }
+  }
+}
+"""
+
+# Both listings come most recently updated first, so callers can stop paging early
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String, $states: [IssueState!], $filterBy: IssueFilters) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, states: $states, filterBy: $filterBy, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { createdAt closedAt updatedAt labels(first: 100) { nodes { name } } }
+    }
+  }
+}
+"""
+
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String, $states: [PullRequestState!]) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, after: $cursor, states: $states, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { createdAt mergedAt updatedAt }
+    }
+  }
+}
+"""
+
+def parse_datetime(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+
+def gql_paginate(repo, query, connection_path, variables=None):
+    """Yield every node of the connection found at connection_path, one query per 100 nodes."""
+    cursor = None
+    while True:
+        connection = run_query(repo, query, {**(variables or {}), "cursor": cursor})
+        for key in connection_path:
+            connection = connection[key] if connection else None
+        if not connection:
+            return
+        yield from connection["nodes"]
+        if not connection["pageInfo"]["hasNextPage"]:
+            return
+        cursor = connection["pageInfo"]["endCursor"]
+
+def gql_fetch_repo_snapshot(repo, root_files=(), since=None, sample_size=200):
+    """
+    Fetch the root listing, the given root files, the .github/workflows listing,
+    issue and pull request counts, issues and pull requests updated since `since`,
+    and the sample_size most recently updated closed issues and merged pull
+    requests, in the same shape as the REST snapshot. The independent listings
+    are fetched concurrently.
+    """
+    def issue_record(node):
+        return {
+            "created_at": parse_datetime(node["createdAt"]),
+            "closed_at": parse_datetime(node["closedAt"]),
+            "updated_at": parse_datetime(node["updatedAt"]),
+            "labels": [label["name"] for label in node["labels"]["nodes"]],
+        }
+
+    def pull_request_record(node):
+        return {
+            "created_at": parse_datetime(node["createdAt"]),
+            "merged_at": parse_datetime(node["mergedAt"]),
+            "updated_at": parse_datetime(node["updatedAt"]),
+        }
+
+    def fetch_issues(variables, limit=None):
+        nodes = gql_paginate(repo, ISSUES_QUERY, ("issues",), variables)
+        return [issue_record(node) for node in islice(nodes, limit)]
+
+    def fetch_pull_requests(variables, limit=None, updated_since=None):
+        records = (pull_request_record(node) for node in gql_paginate(repo, PULL_REQUESTS_QUERY, ("pullRequests",), variables))
+        if updated_since:
+            # Listed most recently updated first, so stop paging at the first older one
+            records = takewhile(lambda pr: pr["updated_at"] >= updated_since, records)
+        return list(islice(records, limit))
+
+    with ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS) as executor:
+        recent_issues = executor.submit(fetch_issues, {"filterBy": {"since": since.isoformat()} if since else None})
+        recent_pull_requests = executor.submit(fetch_pull_requests, {}, None, since)
+        closed_issues = executor.submit(fetch_issues, {"states": ["CLOSED"]}, sample_size)
+        merged_pull_requests = executor.submit(fetch_pull_requests, {"states": ["MERGED"]}, sample_size)
+
+        overview = run_query(repo, REPO_OVERVIEW_QUERY, {})
+        tree = overview["object"] or {}
+        root_entries = [(entry["name"], "dir" if entry["type"] == "tree" else "file") for entry in tree.get("entries", [])]
+        present = {name for name, kind in root_entries if kind == "file"}
+        wanted = [name for name in root_files if name in present]
+
+        return {
+            "root_entries": root_entries,
+            "root_files": gql_fetch_blobs(repo, wanted) if wanted else {},
+            "workflow_files": [entry["name"] for entry in (overview["workflows"] or {}).get("entries", [])],
+            "issue_counts": {
+                "open": overview["openIssues"]["totalCount"],
+                "closed": overview["closedIssues"]["totalCount"],
+            },
+            "pull_request_counts": {
+                "open": overview["openPullRequests"]["totalCount"],
+                "closed": overview["closedPullRequests"]["totalCount"],
+                "merged": overview["mergedPullRequests"]["totalCount"],
+            },
+            "recent_issues": recent_issues.result(),
+            "recent_pull_requests": recent_pull_requests.result(),
+            "closed_issues": closed_issues.result(),
+            "merged_pull_requests": merged_pull_requests.result(),
+        }
@@ -1,143 +1,252 @@
 # issue_analyzer.py
+import os
 import re
+import heapq
+import weakref
 from github import GithubException
 from difflib import SequenceMatcher
 import ast
-from datetime import datetime, timedelta
-
-def get_open_issues(repo, labels=None, keywords=None, limit=10, issue_templates=None):
-    issues = repo.get_issues(state='open', labels=labels)
-    filtered_issues = []
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from github_cache import cached_get_contents, cached_get_comments, cached_get_git_tree, cached_list_directory, cached_search_issues
+from github_graphql import gql_fetch_issue_bundle, gql_fetch_blobs
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional; difflib computes the same ratio, only slower
+    fuzz = process = None
+
+# Patterns used per issue, comment and file are compiled once at import time
+_FILE_RE = re.compile(r'\b(?:[\w-]+/)*[\w-]+\.[a-zA-Z]+\b')
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_INLINE_CODE_RE = re.compile(r'`[^`\n]+`')
+_PY_IMPORT_RE = re.compile(r'^import\s+(\w+)|^from\s+(\w+)\s+import', re.MULTILINE)
+_JS_IMPORT_RE = re.compile(r'require\(\s*[\'"]([^\'"]+)[\'"]\s*\)|from\s+[\'"]([^\'"]+)[\'"]')
+_TEST_FN_RE = re.compile(r'def\s+(test_\w+)')
+_WORD_RE = re.compile(r'\w+')
+
+# From this many keywords on, one alternation scan beats a substring search per keyword
+KEYWORD_REGEX_MIN = 4
+
+def get_open_issues(repo, labels=None, keywords=None, limit=10, issue_templates=None, scan_limit=None):
+    # Recently updated issues tend to score higher, so ask GitHub for them first and
+    # rank a bounded window of candidates rather than the first `limit` returned
+    issues = repo.get_issues(state='open', labels=labels, sort='updated', direction='desc')
+    keywords = [keyword.lower() for keyword in keywords or []]
+    keyword_re = re.compile('|'.join(map(re.escape, keywords))) if len(keywords) >= KEYWORD_REGEX_MIN else None
+    scan_limit = scan_limit or limit * 5
+    now = datetime.now(timezone.utc)
+    top_issues = []  # min-heap of (score, -position, issue) holding the best `limit` issues
     
-    for issue in issues:
-        if len(filtered_issues) >= limit:
-            break
-        
-        if keywords and not any(keyword.lower() in issue.title.lower() or keyword.lower() in (issue.body or '').lower() for keyword in keywords):
-            continue
-        
-        score = score_issue(issue, issue_templates)
-        filtered_issues.append((issue, score))
+    def matches(issue):
+        if not keywords:
+            return True
+        text = f"{issue.title}\n{issue.body or ''}".lower()
+        if keyword_re:
+            return keyword_re.search(text) is not None
+        return any(keyword in text for keyword in keywords)
     
-    return sorted(filtered_issues, key=lambda x: x[1], reverse=True)
+    # The window counts matching issues only, so a strict keyword filter keeps paging until it fills
+    candidates = (issue for issue in issues if matches(issue))
+    for position, issue in enumerate(islice(candidates, scan_limit)):
+        score = score_issue(issue, issue_templates, now)
+        entry = (score, -position, issue)
+        if len(top_issues) < limit:
+            heapq.heappush(top_issues, entry)
+        else:
+            heapq.heappushpop(top_issues, entry)
+    
+    return [(issue, score) for score, _, issue in sorted(top_issues, reverse=True)]
+
+_EASY_LABELS = frozenset({'good first issue', 'help wanted'})
 
-def score_issue(issue, issue_templates):
+# (upper bounds, scores): a value below bounds[i] and not below bounds[i - 1] scores scores[i]
+_DESCRIPTION_LENGTH_BUCKETS = ((50, 100, 501), (0, 2, 3, 0))  # clear but not too long
+_COMMENT_COUNT_BUCKETS = ((1, 5), (2, 1, 0))  # fewer comments, less contested
+_DAYS_OLD_BUCKETS = ((30, 90), (2, 1, 0))  # prefer recent issues
+
+def _bucket_score(value, buckets):
+    bounds, scores = buckets
+    return scores[bisect_right(bounds, value)]
+
+def score_issue(issue, issue_templates, now=None):
     score = 0
+    body = issue.body or ''
+    now = now or datetime.now(timezone.utc)
     
-    if any(label.name.lower() in ['good first issue', 'help wanted'] for label in issue.labels):
+    if _EASY_LABELS.intersection(label.name.lower() for label in issue.labels):
         score += 5
     
-    description_length = len(issue.body or '')
-    if 100 <= description_length <= 500:
-        score += 3
-    elif 50 <= description_length < 100:
-        score += 2
-    
-    comment_count = issue.comments
-    if comment_count == 0:
-        score += 2
-    elif comment_count < 5:
-        score += 1
-    
-    days_old = (datetime.now(issue.created_at.tzinfo) - issue.created_at).days
-    if days_old < 30:
-        score += 2
-    elif days_old < 90:
-        score += 1
+    score += _bucket_score(len(body), _DESCRIPTION_LENGTH_BUCKETS)
+    score += _bucket_score(issue.comments, _COMMENT_COUNT_BUCKETS)
+    score += _bucket_score((now - issue.created_at).days, _DAYS_OLD_BUCKETS)
     
     # Check if the issue follows a template
-    if issue_templates:
-        for template_name, template_content in issue_templates.items():
-            if all(section in (issue.body or '') for section in template_content.keys()):
-                score += 3
-                break
+    template_name, _ = issue_template_match(issue, issue_templates)
+    if template_name:
+        score += 3
 
     return score
 
+def match_template(body, issue_templates):
+    """Return (template_name, sections) for the first template whose sections all appear in body."""
+    for template_name, template_content in (issue_templates or {}).items():
+        sections = list(template_content.keys())
+        if sections and all(section in body for section in sections):
+            return template_name, sections
+    return None, []
+
+# issue -> (issue_templates, match), so score_issue and analyze_issue scan each body once
+_template_matches = weakref.WeakKeyDictionary()
+
+def issue_template_match(issue, issue_templates):
+    cached = _template_matches.get(issue)
+    if cached is not None and cached[0] is issue_templates:
+        return cached[1]
+    match = match_template(issue.body or '', issue_templates)
+    _template_matches[issue] = (issue_templates, match)
+    return match
+
 def find_mentioned_files(text):
     if not text:
         return []
     # Look for file paths (e.g., src/main.py or docs/README.md)
-    file_pattern = r'\b(?:[\w-]+/)*[\w-]+\.[a-zA-Z]+\b'
-    return list(set(re.findall(file_pattern, text)))
-
-def identify_related_files(repo, issue):
-    related_files = set()
-    
-    # Check issue body
-    mentioned_files = find_mentioned_files(issue.body or '')
-    related_files.update(mentioned_files)
-    
-    # Check issue comments
-    for comment in issue.get_comments():
-        mentioned_files = find_mentioned_files(comment.body or '')
-        related_files.update(mentioned_files)
+    return list(set(_FILE_RE.findall(text)))
+
+# Extensions worth looking up; anything else is more likely prose ("e.g", "github.com") than a path
+SOURCE_FILE_EXTENSIONS = frozenset({
+    '.py', '.pyi', '.js', '.jsx', '.ts', '.tsx', '.md', '.rst', '.txt', '.json', '.yml', '.yaml',
+    '.toml', '.cfg', '.ini', '.rs', '.go', '.java', '.kt', '.rb', '.php', '.c', '.h', '.cpp', '.hpp',
+    '.cs', '.swift', '.sh', '.html', '.css', '.scss', '.sql', '.xml',
+})
+
+def normalize_file_path(path):
+    path = path.strip('.,;:)(\'"`')
+    while path.startswith('./'):
+        path = path[2:]
+    path = path.lstrip('/')
+    if ' ' in path or os.path.splitext(path)[1].lower() not in SOURCE_FILE_EXTENSIONS:
+        return None
+    return path
+
+def find_related_file_candidates(body, comment_bodies):
+    # Normalize before deduplicating so "./src/main.py" and "src/main.py." cost one lookup
+    mentioned_files = set(find_mentioned_files(body))
+    for comment_body in comment_bodies:
+        mentioned_files.update(find_mentioned_files(comment_body))
+    candidates = {normalize_file_path(path) for path in mentioned_files}
+    candidates.discard(None)
+    return candidates
+
+def identify_related_files(repo, issue, comments=None, executor=None):
+    # Check issue body and comments; pass already-fetched comments to avoid paging them again
+    if comments is None:
+        comments = cached_get_comments(repo, issue)
+    related_files = find_related_file_candidates(issue.body or '', (comment.body or '' for comment in comments))
     
-    # Verify that the mentioned files actually exist in the repository
-    existing_files = set()
-    for file_path in related_files:
-        try:
-            repo.get_contents(file_path)
-            existing_files.add(file_path)
-        except GithubException:
-            pass  # File doesn't exist, skip it
+    # Verify that the mentioned files actually exist in the repository; the checks are independent
+    related_files = list(related_files)
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS) if executor is None else nullcontext(executor)
+    with pool as executor:
+        exists = list(executor.map(lambda file_path: file_exists(repo, file_path), related_files))
     
-    return list(existing_files)
+    return [file_path for file_path, found in zip(related_files, exists) if found]
+
+def file_exists(repo, file_path):
+    try:
+        cached_get_contents(repo, file_path)
+        return True
+    except GithubException:
+        return False  # File doesn't exist, skip it
+
+# Classification rules, in priority order
+ISSUE_CATEGORIES = {
+    'bug': ['bug', 'error', 'problem', 'fail', 'defect', 'broken'],
+    'feature request': ['feature request', 'enhancement', 'new feature', 'add', 'request'],
+    'documentation': ['documentation', 'docs', 'typo', 'readme', 'wiki'],
+    'question': ['question', 'help', 'how to', 'how do i', '?'],
+    'enhancement': ['enhancement', 'improve', 'optimization', 'performance'],
+}
+
+# Label names match keywords exactly, so the first category claiming a keyword wins
+_LABEL_CATEGORIES = {}
+for _category, _keywords in ISSUE_CATEGORIES.items():
+    for _keyword in _keywords:
+        _LABEL_CATEGORIES.setdefault(_keyword, _category)
+
+# One pattern with a named group per category, in priority order. Wrapping it in a lookahead
+# reports the highest-priority keyword starting at every position, so overlapping keywords
+# from different categories are never hidden from each other.
+_CATEGORY_GROUPS = {category.replace(' ', '_'): category for category in ISSUE_CATEGORIES}
+_CATEGORY_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{group}>{'|'.join(map(re.escape, ISSUE_CATEGORIES[category]))})"
+    for group, category in _CATEGORY_GROUPS.items()) + ')')
+_CATEGORY_PRIORITY = {category: priority for priority, category in enumerate(ISSUE_CATEGORIES)}
 
 def classify_issue(issue):
     title = issue.title.lower()
     body = (issue.body or '').lower()
     labels = [label.name.lower() for label in issue.labels]
 
-    # Define classification rules
-    categories = {
-        'bug': ['bug', 'error', 'problem', 'fail', 'defect', 'broken'],
-        'feature request': ['feature request', 'enhancement', 'new feature', 'add', 'request'],
-        'documentation': ['documentation', 'docs', 'typo', 'readme', 'wiki'],
-        'question': ['question', 'help', 'how to', 'how do i', '?'],
-        'enhancement': ['enhancement', 'improve', 'optimization', 'performance'],
-    }
-
     # Check labels first
-    for category, keywords in categories.items():
-        if any(keyword in labels for keyword in keywords):
-            return category
-
-    # Check title and body
-    for category, keywords in categories.items():
-        if any(keyword in title or keyword in body for keyword in keywords):
-            return category
+    label_categories = [_LABEL_CATEGORIES[label] for label in labels if label in _LABEL_CATEGORIES]
+    if label_categories:
+        return min(label_categories, key=_CATEGORY_PRIORITY.get)
+
+    # Check title and body in a single scan, keeping the highest-priority category seen
+    best = None
+    for match in _CATEGORY_RE.finditer(f"{title}\n{body}"):
+        category = _CATEGORY_GROUPS[match.lastgroup]
+        if best is None or _CATEGORY_PRIORITY[category] < _CATEGORY_PRIORITY[best]:
+            best = category
+            if _CATEGORY_PRIORITY[best] == 0:
+                break
+    if best is not None:
+        return best
 
     # If no category is found, return 'other'
     return 'other'
 
 def extract_code_snippets(text):
     # Extract code blocks (```code```)
-    code_blocks = re.findall(r'```[\s\S]*?```', text)
+    code_blocks = _CODE_BLOCK_RE.findall(text)
     
     # Extract inline code (`code`)
-    inline_code = re.findall(r'`[^`\n]+`', text)
+    inline_code = _INLINE_CODE_RE.findall(text)
     
     return code_blocks + inline_code
 
+# Larger files (generated, minified, vendored) cost a lot to decode and add nothing to the analysis
+MAX_FILE_SIZE = 256 * 1024
+
 def get_file_content(repo, file_path):
     try:
-        content = repo.get_contents(file_path)
-        return content.decoded_content.decode('utf-8')
+        content = cached_get_contents(repo, file_path)
+        if content.size > MAX_FILE_SIZE:
+            return None
+        return content.decoded_content.decode('utf-8', errors='replace')
     except GithubException:
         return None
 
-def analyze_dependencies(repo, related_files):
+def get_file_contents(repo, file_paths, executor=None):
+    # Fetch and decode each file once so every analysis step can share the result
+    if executor is None:
+        return {file_path: get_file_content(repo, file_path) for file_path in file_paths}
+    return dict(zip(file_paths, executor.map(lambda file_path: get_file_content(repo, file_path), file_paths)))
+
+def analyze_dependencies(file_contents):
     dependency_info = {}
-    for file in related_files:
-        content = get_file_content(repo, file)
+    for file, content in file_contents.items():
         if content:
             if file.endswith('.py'):
-                imports = re.findall(r'^import\s+(\w+)|^from\s+(\w+)\s+import', content, re.MULTILINE)
+                imports = _PY_IMPORT_RE.findall(content)
                 dependency_info[file] = list(set([imp[0] or imp[1] for imp in imports]))
             elif file.endswith('.js'):
-                imports = re.findall(r'(const|let|var)\s+{\s*([^}]+)\s*}\s*=\s*require$$[\'"]([^\'"]+)[\'"]$$|import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]', content)
-                dependency_info[file] = list(set([imp[2] or imp[3] for imp in imports]))
+                imports = _JS_IMPORT_RE.finditer(content)
+                dependency_info[file] = list({m.group(1) or m.group(2) for m in imports})
     return dependency_info
 
 def identify_test_files(repo, related_files):
@@ -148,86 +257,109 @@ def identify_test_files(repo, related_files):
     
     # If no test files found in related files, search the repo
     if not test_files:
-        contents = repo.get_contents("")
-        for content in contents:
-            if content.type == "dir" and "test" in content.path.lower():
-                test_files.extend(find_test_files_in_dir(repo, content.path))
+        tree = cached_get_git_tree(repo)
+        if tree is None:
+            # Truncated listing: walk only the top-level test directories
+            tree = list_test_directories(repo)
+        test_files = find_test_files_in_tree(tree)
     
     return test_files
 
-def find_test_files_in_dir(repo, dir_path):
+def list_test_directories(repo):
+    entries = []
+    pending = [entry.path for entry in cached_list_directory(repo, "") if entry.type == "tree" and "test" in entry.path.lower()]
+    while pending:
+        for entry in cached_list_directory(repo, pending.pop()):
+            entries.append(entry)
+            if entry.type == "tree":
+                pending.append(entry.path)
+    return entries
+
+def find_test_files_in_tree(tree):
     test_files = []
-    contents = repo.get_contents(dir_path)
-    for content in contents:
-        if content.type == "file" and (content.name.startswith('test_') or content.name.endswith('_test.py')):
-            test_files.append(content.path)
-        elif content.type == "dir":
-            test_files.extend(find_test_files_in_dir(repo, content.path))
+    for entry in tree:
+        if entry.type != "blob" or '/' not in entry.path:
+            continue
+        top_dir = entry.path.split('/', 1)[0]
+        file_name = os.path.basename(entry.path)
+        if "test" in top_dir.lower() and (file_name.startswith('test_') or file_name.endswith('_test.py')):
+            test_files.append(entry.path)
     return test_files
 
-def extract_test_cases(repo, test_files):
+def extract_test_cases(test_file_contents):
     test_cases = {}
-    for file in test_files:
-        content = get_file_content(repo, file)
+    for file, content in test_file_contents.items():
         if content:
             # Extract test function names
-            test_functions = re.findall(r'def\s+(test_\w+)', content)
+            test_functions = _TEST_FN_RE.findall(content)
             if test_functions:
                 test_cases[file] = test_functions
     return test_cases
 
-def find_similar_resolved_issues(repo, issue, limit=5):
+# Words too common in issue titles to narrow down a search
+_TITLE_STOPWORDS = frozenset({
+    'the', 'and', 'for', 'with', 'from', 'into', 'when', 'not', 'does', 'doesn', 'can', 'cannot',
+    'should', 'would', 'could', 'this', 'that', 'are', 'was', 'were', 'has', 'have', 'after',
+    'before', 'using', 'use', 'issue', 'bug', 'error', 'feature', 'request', 'add', 'support',
+})
+
+def title_search_terms(title, max_terms=5):
+    terms = []
+    for word in _WORD_RE.findall((title or '').lower()):
+        if len(word) > 2 and word not in _TITLE_STOPWORDS and word not in terms:
+            terms.append(word)
+    return terms[:max_terms]
+
+SIMILARITY_THRESHOLD = 0.5  # Adjust this threshold as needed
+
+def find_similar_resolved_issues(repo, issue, limit=5, candidates=50):
     similar_issues = []
-    closed_issues = repo.get_issues(state='closed')
-    
-    for closed_issue in closed_issues:
-        if closed_issue.number == issue.number:
+
+    # Let GitHub's search narrow closed issues down by title terms instead of paging through all of them
+    terms = title_search_terms(issue.title)
+    if not terms:
+        return similar_issues
+    query = f"repo:{repo.full_name} is:issue is:closed in:title {' OR '.join(terms)}"
+    closed_issues = {ci.number: ci for ci in cached_search_issues(repo, query, limit=candidates) if ci.number != issue.number}
+
+    if process is not None:
+        # process.extract scores and picks the top matches in C; scores are 0-100
+        titles = {number: ci.title for number, ci in closed_issues.items()}
+        matches = process.extract(issue.title, titles, scorer=fuzz.ratio, limit=limit,
+                                  score_cutoff=SIMILARITY_THRESHOLD * 100)
+        return [(closed_issues[number], score / 100) for _, score, number in matches]
+
+    # SequenceMatcher indexes its second sequence, so the fixed title goes there and is indexed once.
+    # difflib is not symmetric: about a third of short title pairs score differently with the titles swapped
+    matcher = SequenceMatcher(None, b=issue.title)
+    for closed_issue in closed_issues.values():
+        matcher.set_seq1(closed_issue.title)
+        # real_quick_ratio() and quick_ratio() are cheap upper bounds on ratio()
+        if matcher.real_quick_ratio() <= SIMILARITY_THRESHOLD or matcher.quick_ratio() <= SIMILARITY_THRESHOLD:
             continue
-        
-        similarity = SequenceMatcher(None, issue.title, closed_issue.title).ratio()
-        if similarity > 0.5:  # Adjust this threshold as needed
+        similarity = matcher.ratio()
+        if similarity > SIMILARITY_THRESHOLD:
             similar_issues.append((closed_issue, similarity))
     
     similar_issues.sort(key=lambda x: x[1], reverse=True)
     return similar_issues[:limit]
 
+# Nodes that each add one to a file's complexity score
+_COMPLEXITY_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.If, ast.While, ast.For, ast.AsyncFor)
+
 def calculate_code_complexity(content):
     try:
         tree = ast.parse(content)
-        visitor = ComplexityVisitor()
-        visitor.visit(tree)
-        return visitor.complexity
-    except SyntaxError:
+    except (SyntaxError, ValueError, RecursionError):
         return None
+    return sum(1 for node in ast.walk(tree) if isinstance(node, _COMPLEXITY_NODES))
 
-class ComplexityVisitor(ast.NodeVisitor):
-    def __init__(self):
-        self.complexity = 0
-
-    def visit_FunctionDef(self, node):
-        self.complexity += 1
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node):
-        self.complexity += 1
-        self.generic_visit(node)
-
-    def visit_If(self, node):
-        self.complexity += 1
-        self.generic_visit(node)
-
-    def visit_While(self, node):
-        self.complexity += 1
-        self.generic_visit(node)
-
-    def visit_For(self, node):
-        self.complexity += 1
-        self.generic_visit(node)
-
-def analyze_code_area_complexity(repo, related_files):
+def analyze_code_area_complexity(file_contents):
     complexity_analysis = {}
-    for file in related_files:
-        content = get_file_content(repo, file)
+    for file, content in file_contents.items():
+        # Only Python sources can be parsed; skip the failed ast.parse on everything else
+        if not file.endswith(('.py', '.pyi')):
+            continue
         if content:
             complexity = calculate_code_complexity(content)
             if complexity is not None:
@@ -306,50 +438,72 @@ def generate_context_aware_guide(repo, issue_analysis, automated_fix_suggestions
 
     return guide
 
+# GitHub calls are I/O-bound, so independent lookups are overlapped on a thread pool
+MAX_WORKERS = 8
+
+def fetch_issue_context(repo, issue, executor):
+    """
+    Return (comment bodies, label names, {related file: content}) for an issue.
+    Two GraphQL queries cover it when authenticated; otherwise the REST helpers are used.
+    """
+    try:
+        bundle = gql_fetch_issue_bundle(repo, issue.number)
+        candidates = find_related_file_candidates(bundle["body"], bundle["comments"])
+        # Paths that don't exist are simply missing from the result
+        file_contents = gql_fetch_blobs(repo, candidates, max_size=MAX_FILE_SIZE)
+        return bundle["comments"], bundle["labels"], file_contents
+    except GithubException:
+        comments = cached_get_comments(repo, issue)
+        related_files = identify_related_files(repo, issue, comments, executor)
+        file_contents = get_file_contents(repo, related_files, executor)
+        return [comment.body or '' for comment in comments], [l.name for l in issue.labels], file_contents
+
 def analyze_issue(repo, issue, issue_templates):
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        similar_issues_future = executor.submit(find_similar_resolved_issues, repo, issue)
+
+        # Related file contents are fetched once for the dependency and complexity analyses
+        comments, labels, file_contents = fetch_issue_context(repo, issue, executor)
+        related_files = list(file_contents)
+
+        test_files = identify_test_files(repo, related_files)
+        test_file_contents = get_file_contents(repo, test_files, executor)
+
+        similar_resolved_issues = similar_issues_future.result()
+
+    body = issue.body or ''
+    template_name, filled_sections = issue_template_match(issue, issue_templates)
     analysis = {
         "issue_number": issue.number,
         "title": issue.title or '',
-        "body": issue.body or '',
-        "labels": [l.name for l in issue.labels],
-        "comments": [comment.body or '' for comment in issue.get_comments()],
-        "follows_template": False,
-        "template_name": None,
-        "filled_sections": [],
-        "related_files": identify_related_files(repo, issue),
+        "body": body,
+        "labels": labels,
+        "comments": comments,
+        "follows_template": template_name is not None,
+        "template_name": template_name,
+        "filled_sections": list(filled_sections),
+        "related_files": related_files,
         "category": classify_issue(issue),
-        "code_snippets": extract_code_snippets(issue.body or ''),
+        "code_snippets": extract_code_snippets(body),
         "dependency_context": {},
-        "test_files": [],
+        "test_files": test_files,
         "test_cases": {},
-        "similar_resolved_issues": [],
+        "similar_resolved_issues": similar_resolved_issues,
         "code_area_complexity": {}
     }
 
-    if issue_templates:
-        for template_name, template_content in issue_templates.items():
-            if all(section in analysis["body"] for section in template_content.keys()):
-                analysis["follows_template"] = True
-                analysis["template_name"] = template_name
-                analysis["filled_sections"] = list(template_content.keys())
-                break
-
     # Extract code snippets from comments
     for comment in analysis["comments"]:
         analysis["code_snippets"].extend(extract_code_snippets(comment))
 
     # Analyze dependencies for related files
-    analysis["dependency_context"] = analyze_dependencies(repo, analysis["related_files"])
-
-    # Identify test files and cases
-    analysis["test_files"] = identify_test_files(repo, analysis["related_files"])
-    analysis["test_cases"] = extract_test_cases(repo, analysis["test_files"])
+    analysis["dependency_context"] = analyze_dependencies(file_contents)
 
-    # Find similar resolved issues
-    analysis["similar_resolved_issues"] = find_similar_resolved_issues(repo, issue)
+    # Extract test cases from the related test files
+    analysis["test_cases"] = extract_test_cases(test_file_contents)
 
     # Analyze code area complexity
-    analysis["code_area_complexity"] = analyze_code_area_complexity(repo, analysis["related_files"])
+    analysis["code_area_complexity"] = analyze_code_area_complexity(file_contents)
 
     # Generate automated fix suggestions
     analysis["automated_fix_suggestions"] = suggest_automated_fix(analysis)
@@ -1,44 +1,243 @@
-import os
 import re
 import json
-import base64
-from github import Github
+import time
+from github import GithubException, RateLimitExceededException
 from tqdm import tqdm
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from github_auth import create_github_client
+from github_cache import api_cache, cached_get_contents, cached_search_count, cached_search_issues
+from github_graphql import gql_fetch_repo_snapshot
 
-def get_setup_instructions(repo):
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; the standard library parses package.json the same way, only slower
+    json_loads = json.loads
+
+# Path-like tokens: slash-separated segments ending in a .extension, without surrounding
+# punctuation such as backticks or parentheses
+_MENTIONED_FILE_RE = re.compile(r'(?:[\w.-]+/)+[\w.-]+\.\w+')
+# A "## " section and everything up to the next heading
+_SETUP_SECTION_RE = re.compile(r'## (installation|setup|getting started).*?(?=##|\Z)', re.IGNORECASE | re.DOTALL)
+_CONTRIB_SECTION_RE = re.compile(r'## (contributing|how to contribute).*?(?=##|\Z)', re.IGNORECASE | re.DOTALL)
+
+SETUP_FILES = ["README.md", "CONTRIBUTING.md", "SETUP.md", "CONTRIBUTE.md"]
+# Root files whose contents the analyzers read; everything else only needs the root listing.
+# They are fetched together with the snapshot: one aliased GraphQL blob query, or parallel
+# REST reads, so get_setup_instructions never waits on a request per file
+ROOT_FILES_TO_READ = SETUP_FILES + [".gitignore", "package.json", "requirements.txt"]
+RECENT_ACTIVITY_DAYS = 30
+# Most recently closed issues / merged pull requests used for the average close and merge times
+CLOSE_TIME_SAMPLE_SIZE = 200
+
+def call_with_rate_limit_wait(fetch):
+    """Call fetch(), sleeping until GitHub's rate limit resets whenever it reports the limit exhausted."""
+    while True:
+        try:
+            return fetch()
+        except RateLimitExceededException as e:
+            headers = e.headers or {}
+            if "retry-after" in headers:
+                delay = int(headers["retry-after"])
+            elif "x-ratelimit-reset" in headers:
+                delay = int(headers["x-ratelimit-reset"]) - time.time()
+            else:
+                delay = 60
+            time.sleep(max(delay, 0) + 1)
+
+def get_repo_snapshot(repo):
+    """
+    Collect everything the repository analyzers need: the root listing, the contents
+    of ROOT_FILES_TO_READ, the .github/workflows listing, issue and pull request counts,
+    recently updated issues and pull requests, a sample of closed issues and merged
+    pull requests, and commit activity.
+    Uses a handful of GraphQL queries, falling back to REST when GraphQL is unavailable.
+    The snapshot goes through api_cache, so repeat runs within its TTL (and across runs
+    when ISSUE_CONTRIBUTOR_CACHE_DIR is set) make no requests.
+    """
+    def fetch():
+        since = datetime.now(timezone.utc) - timedelta(days=RECENT_ACTIVITY_DAYS)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The statistics endpoints may need retries, so start them first
+            commit_activity = executor.submit(get_commit_activity, repo, since)
+            try:
+                snapshot = call_with_rate_limit_wait(
+                    lambda: gql_fetch_repo_snapshot(repo, ROOT_FILES_TO_READ, since, CLOSE_TIME_SAMPLE_SIZE)
+                )
+            except GithubException:
+                snapshot = get_repo_snapshot_rest(repo, since)
+            snapshot["commit_activity"] = commit_activity.result()
+        return snapshot
+    return api_cache.get(repo, "repo_snapshot", tuple(ROOT_FILES_TO_READ), fetch)
+
+# Concurrent page requests per listing, to stay clear of GitHub's secondary rate limits
+MAX_PAGE_WORKERS = 5
+
+def fetch_all_pages(repo, paginated_list):
+    """Fetch every page of a PaginatedList concurrently instead of following next links one by one."""
+    per_page = repo.requester.per_page
+    page_count = -(-paginated_list.totalCount // per_page)
+    with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+        return [item for page in executor.map(paginated_list.get_page, range(page_count)) for item in page]
+
+def list_workflow_files(repo):
+    try:
+        return [content.name for content in call_with_rate_limit_wait(lambda: cached_get_contents(repo, ".github/workflows"))]
+    except GithubException as e:
+        if e.status == 404:
+            return []
+        raise
+
+def get_repo_snapshot_rest(repo, since):
+    def read_root_file(file_name):
+        try:
+            content = call_with_rate_limit_wait(lambda: cached_get_contents(repo, file_name))
+        except GithubException as e:
+            if e.status == 404:
+                return None
+            raise
+        return content.decoded_content.decode('utf-8', 'replace')
+
+    def closed_issues():
+        listing = repo.get_issues(state='closed', sort='updated', direction='desc')
+        return [
+            {"created_at": issue.created_at, "closed_at": issue.closed_at}
+            for issue in islice(listing, CLOSE_TIME_SAMPLE_SIZE)
+            if issue.pull_request is None
+        ]
+
+    def merged_pull_requests():
+        listing = repo.get_pulls(state='closed', sort='updated', direction='desc')
+        # merged_at is in the list payload; pr.merged would fetch each PR again
+        return [
+            {"created_at": pr.created_at, "merged_at": pr.merged_at}
+            for pr in islice(listing, CLOSE_TIME_SAMPLE_SIZE)
+            if pr.merged_at
+        ]
+
+    count_queries = {
+        ("issue_counts", "open"): "is:issue is:open",
+        ("issue_counts", "closed"): "is:issue is:closed",
+        ("pull_request_counts", "open"): "is:pr is:open",
+        ("pull_request_counts", "closed"): "is:pr is:closed is:unmerged",
+        ("pull_request_counts", "merged"): "is:pr is:merged",
+    }
+
+    with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+        counts = {key: executor.submit(cached_search_count, repo, qualifiers) for key, qualifiers in count_queries.items()}
+        # The issues endpoint lists pull requests too, so one since= listing covers both
+        recent = executor.submit(fetch_all_pages, repo, repo.get_issues(state='all', since=since))
+        closed = executor.submit(closed_issues)
+        merged = executor.submit(merged_pull_requests)
+
+        root_entries = [(content.name, content.type) for content in cached_get_contents(repo, "")]
+        present = {name for name, kind in root_entries if kind == "file"}
+        wanted = [file_name for file_name in ROOT_FILES_TO_READ if file_name in present]
+        root_files = dict(zip(wanted, executor.map(read_root_file, wanted)))
+        workflow_files = list_workflow_files(repo) if (".github", "dir") in root_entries else []
+
+        snapshot = {
+            "root_entries": root_entries,
+            "root_files": root_files,
+            "workflow_files": workflow_files,
+            "issue_counts": {},
+            "pull_request_counts": {},
+            "recent_issues": [
+                {"updated_at": issue.updated_at, "labels": [label.name for label in issue.labels]}
+                for issue in recent.result()
+                if issue.pull_request is None  # Exclude PRs from issue count
+            ],
+            "recent_pull_requests": [{"updated_at": item.updated_at} for item in recent.result() if item.pull_request is not None],
+            "closed_issues": closed.result(),
+            "merged_pull_requests": merged.result(),
+        }
+        for (group, state), count in counts.items():
+            snapshot[group][state] = count.result()
+    return snapshot
+
+STATS_ATTEMPTS = 3
+STATS_RETRY_DELAY = 2  # seconds
+
+def get_repo_stats(fetch):
+    # GitHub computes statistics on demand and answers 202 (None here) until they are ready
+    for attempt in range(STATS_ATTEMPTS):
+        stats = fetch()
+        if stats:
+            return stats
+        if attempt + 1 < STATS_ATTEMPTS:
+            time.sleep(STATS_RETRY_DELAY)
+    return None
+
+def get_commit_activity(repo, since):
+    """
+    Summarize default-branch commits from the statistics endpoints, which aggregate
+    the whole history in one response each. Falls back to pagination counts when
+    the statistics are not ready.
+    """
+    contributors = get_repo_stats(repo.get_stats_contributors)
+    weekly_activity = get_repo_stats(repo.get_stats_commit_activity) if contributors else None
+    if contributors and weekly_activity:
+        return {
+            "total": sum(contributor.total for contributor in contributors),
+            "recent": sum(
+                count
+                for week in weekly_activity
+                for offset, count in enumerate(week.days)
+                if week.week + timedelta(days=offset) >= since
+            ),
+            "contributors": [
+                (contributor.author.login, contributor.total)
+                for contributor in sorted(contributors, key=lambda contributor: contributor.total, reverse=True)
+                if contributor.author
+            ],
+            "first_commit_date": min((week.w for contributor in contributors for week in contributor.weeks if week.c), default=None),
+        }
+
+    # Without statistics, read counts from pagination and only fetch the page holding the first commit
+    commits = repo.get_commits()
+    total = commits.totalCount
+    last_page = -(-total // repo.requester.per_page) - 1
+    # Commits are listed newest first, so the last one is the first commit
+    first_commit = commits.get_page(last_page)[-1] if total else None
+    return {
+        "total": total,
+        "recent": repo.get_commits(since=since).totalCount,
+        "contributors": [(contributor.login, contributor.contributions) for contributor in repo.get_contributors().get_page(0)],
+        "first_commit_date": first_commit.commit.author.date if first_commit else None,
+    }
+
+def get_setup_instructions(snapshot):
     """
     Extract setup instructions and contribution guidelines from README and CONTRIBUTING files.
     """
-    files_to_check = ["README.md", "CONTRIBUTING.md", "SETUP.md", "CONTRIBUTE.md"]
     setup_info = {
         "setup_instructions": "",
         "contribution_guidelines": "",
     }
     
-    for file_name in files_to_check:
-        try:
-            content = repo.get_contents(file_name).decoded_content.decode('utf-8')
-            
-            # Look for setup instructions
-            setup_match = re.search(r'(?i)## (installation|setup|getting started).*?(?=##|\Z)', content, re.DOTALL)
-            if setup_match and not setup_info["setup_instructions"]:
-                setup_info["setup_instructions"] = setup_match.group(0).strip()
-            
-            # Look for contribution guidelines
-            contrib_match = re.search(r'(?i)## (contributing|how to contribute).*?(?=##|\Z)', content, re.DOTALL)
-            if contrib_match and not setup_info["contribution_guidelines"]:
-                setup_info["contribution_guidelines"] = contrib_match.group(0).strip()
-            
-            if setup_info["setup_instructions"] and setup_info["contribution_guidelines"]:
-                break
-        except:
+    for file_name in SETUP_FILES:
+        content = snapshot["root_files"].get(file_name)
+        if not content:
             continue
+        
+        # Look for setup instructions
+        setup_match = _SETUP_SECTION_RE.search(content)
+        if setup_match and not setup_info["setup_instructions"]:
+            setup_info["setup_instructions"] = setup_match.group(0).strip()
+        
+        # Look for contribution guidelines
+        contrib_match = _CONTRIB_SECTION_RE.search(content)
+        if contrib_match and not setup_info["contribution_guidelines"]:
+            setup_info["contribution_guidelines"] = contrib_match.group(0).strip()
+        
+        if setup_info["setup_instructions"] and setup_info["contribution_guidelines"]:
+            break
     
     return setup_info
 
-def identify_project_structure(repo):
+def identify_project_structure(repo, snapshot):
     """
     Identify project structure and attempt to infer coding standards.
     """
@@ -49,14 +248,13 @@ def identify_project_structure(repo):
         "potential_standards": []
     }
     
-    contents = repo.get_contents("")
-    for content in contents:
-        if content.type == "dir":
-            structure["directories"].append(content.name)
-        elif content.type == "file":
-            if content.name in [".editorconfig", ".pylintrc", "tox.ini", "setup.cfg"]:
-                structure["important_files"].append(content.name)
-                structure["potential_standards"].append(f"Possible use of {content.name} for code style")
+    for name, kind in snapshot["root_entries"]:
+        if kind == "dir":
+            structure["directories"].append(name)
+        elif kind == "file":
+            if name in [".editorconfig", ".pylintrc", "tox.ini", "setup.cfg"]:
+                structure["important_files"].append(name)
+                structure["potential_standards"].append(f"Possible use of {name} for code style")
     
     # Infer potential standards based on project structure
     if "tests" in structure["directories"]:
@@ -66,7 +264,7 @@ def identify_project_structure(repo):
     
     return structure
 
-def analyze_repository_files(repo):
+def analyze_repository_files(repo, snapshot):
     """Analyze repository files for community health, CI/CD, and language-specific information."""
     analysis = {
         "community_health": [],
@@ -78,43 +276,38 @@ def analyze_repository_files(repo):
     community_files = ["CODE_OF_CONDUCT.md", "CONTRIBUTING.md", "SECURITY.md", "SUPPORT.md"]
     ci_cd_files = [".travis.yml", ".github/workflows", "azure-pipelines.yml", "Jenkinsfile", ".gitlab-ci.yml"]
     important_files = [".gitignore", "README.md", "LICENSE"]
+    root_files = snapshot["root_files"]
+    present_files = set()
     
-    contents = repo.get_contents("")
-    for content in contents:
-        if content.type == "file":
-            if content.name in community_files:
-                analysis["community_health"].append(content.name)
-            elif content.name in ci_cd_files or (content.name == "workflows" and content.path == ".github/workflows"):
-                analysis["ci_cd"].append(content.name)
-            elif content.name in important_files:
-                analysis["important_files"].append(content.name)
-                if content.name == ".gitignore":
-                    analysis["gitignore_content"] = base64.b64decode(content.content).decode('utf-8')
-        elif content.type == "dir" and content.path == ".github/workflows":
-            analysis["ci_cd"].append("GitHub Actions")
+    for name, kind in snapshot["root_entries"]:
+        if kind == "file":
+            present_files.add(name)
+            if name in community_files:
+                analysis["community_health"].append(name)
+            elif name in ci_cd_files:
+                analysis["ci_cd"].append(name)
+            elif name in important_files:
+                analysis["important_files"].append(name)
+                if name == ".gitignore" and root_files.get(name) is not None:
+                    analysis["gitignore_content"] = root_files[name]
+    
+    if snapshot["workflow_files"]:
+        analysis["ci_cd"].append("GitHub Actions")
     
     # Language-specific analysis
     if repo.language:
         analysis["language_specific"]["primary_language"] = repo.language
         if repo.language.lower() == "python":
-            python_files = ["requirements.txt", "setup.py", "Pipfile"]
-            for file in python_files:
-                try:
-                    repo.get_contents(file)
-                    analysis["language_specific"]["python_files"] = analysis["language_specific"].get("python_files", []) + [file]
-                except:
-                    pass
+            python_files = [file for file in ["requirements.txt", "setup.py", "Pipfile"] if file in present_files]
+            if python_files:
+                analysis["language_specific"]["python_files"] = python_files
         elif repo.language.lower() == "javascript":
-            try:
-                package_json = repo.get_contents("package.json")
-                package_content = base64.b64decode(package_json.content).decode('utf-8')
-                analysis["language_specific"]["package_json"] = package_content
-            except:
-                pass
+            if root_files.get("package.json") is not None:
+                analysis["language_specific"]["package_json"] = root_files["package.json"]
     
     return analysis
 
-def analyze_issue_pr_trends(repo):
+def analyze_issue_pr_trends(snapshot):
     """Analyze trends in issues and pull requests."""
     analysis = {
         "issues": {"open": 0, "closed": 0, "recent_activity": 0},
@@ -123,78 +316,59 @@ def analyze_issue_pr_trends(repo):
         "avg_time_to_close_issues": None,
         "avg_time_to_merge_prs": None
     }
+    analysis["issues"].update(snapshot["issue_counts"])
+    analysis["pull_requests"].update(snapshot["pull_request_counts"])
     
-    # Analyze issues
-    issues = repo.get_issues(state='all')
-    issue_close_times = []
+    # Analyze recently updated issues; GitHub timestamps are UTC-aware
+    cutoff = datetime.now(timezone.utc) - timedelta(days=RECENT_ACTIVITY_DAYS)
     label_counter = Counter()
-    for issue in issues:
-        if issue.pull_request is None:  # Exclude PRs from issue count
-            if issue.state == 'open':
-                analysis["issues"]["open"] += 1
-            else:
-                analysis["issues"]["closed"] += 1
-                if issue.closed_at:
-                    issue_close_times.append((issue.closed_at - issue.created_at).total_seconds())
-            if datetime.now(issue.updated_at.tzinfo) - issue.updated_at < timedelta(days=30):
-                analysis["issues"]["recent_activity"] += 1
-            for label in issue.labels:
-                label_counter[label.name] += 1
-    
-    # Analyze pull requests
-    pulls = repo.get_pulls(state='all')
-    pr_merge_times = []
-    for pr in pulls:
-        if pr.state == 'open':
-            analysis["pull_requests"]["open"] += 1
-        elif pr.merged:
-            analysis["pull_requests"]["merged"] += 1
-            if pr.merged_at:
-                pr_merge_times.append((pr.merged_at - pr.created_at).total_seconds())
-        else:
-            analysis["pull_requests"]["closed"] += 1
-        if datetime.now(pr.updated_at.tzinfo) - pr.updated_at < timedelta(days=30):
-            analysis["pull_requests"]["recent_activity"] += 1
-    
-    # Calculate averages
+    for issue in snapshot["recent_issues"]:
+        if issue["updated_at"] > cutoff:
+            analysis["issues"]["recent_activity"] += 1
+        label_counter.update(issue["labels"])
+    
+    analysis["pull_requests"]["recent_activity"] = sum(1 for pr in snapshot["recent_pull_requests"] if pr["updated_at"] > cutoff)
+    
+    # Calculate averages over the most recently closed issues and merged PRs
+    issue_close_times = [
+        (issue["closed_at"] - issue["created_at"]).total_seconds()
+        for issue in snapshot["closed_issues"]
+        if issue["closed_at"]
+    ]
+    pr_merge_times = [(pr["merged_at"] - pr["created_at"]).total_seconds() for pr in snapshot["merged_pull_requests"]]
     if issue_close_times:
         analysis["avg_time_to_close_issues"] = sum(issue_close_times) / len(issue_close_times) / 86400  # Convert to days
     if pr_merge_times:
         analysis["avg_time_to_merge_prs"] = sum(pr_merge_times) / len(pr_merge_times) / 86400  # Convert to days
     
-    # Get top 5 issue labels
+    # Get top 5 labels among recently updated issues
     analysis["top_issue_labels"] = [label for label, _ in label_counter.most_common(5)]
     
     return analysis
 
-def analyze_commit_history(repo):
+def analyze_commit_history(snapshot):
     """Analyze the commit history of the repository."""
+    activity = snapshot["commit_activity"]
     analysis = {
-        "total_commits": 0,
-        "recent_commits": 0,
-        "top_contributors": [],
+        "total_commits": activity["total"],
+        "recent_commits": activity["recent"],
+        "top_contributors": [login for login, _ in activity["contributors"][:5]],
         "commit_frequency": None
     }
     
-    commits = repo.get_commits()
-    contributor_counter = Counter()
-    
-    for commit in commits:
-        analysis["total_commits"] += 1
-        if datetime.now(commit.commit.author.date.tzinfo) - commit.commit.author.date < timedelta(days=30):
-            analysis["recent_commits"] += 1
-        if commit.author:
-            contributor_counter[commit.author.login] += 1
-    
-    analysis["top_contributors"] = [contributor for contributor, _ in contributor_counter.most_common(5)]
-    
-    if analysis["total_commits"] > 0:
-        days_since_first_commit = (datetime.now(commits[analysis["total_commits"]-1].commit.author.date.tzinfo) - commits[analysis["total_commits"]-1].commit.author.date).days
+    first_commit_date = activity["first_commit_date"]
+    if analysis["total_commits"] > 0 and first_commit_date:
+        days_since_first_commit = (datetime.now(timezone.utc) - first_commit_date).days
         analysis["commit_frequency"] = analysis["total_commits"] / max(days_since_first_commit, 1)
     
     return analysis
 
-def analyze_dependencies(repo):
+def parse_requirements(text):
+    # Drop comments, blank lines and pip options such as -r other.txt or --index-url
+    requirements = (line.split('#', 1)[0].strip() for line in text.splitlines())
+    return [requirement for requirement in requirements if requirement and not requirement.startswith('-')]
+
+def analyze_dependencies(snapshot):
     """Analyze the dependencies of the repository."""
     analysis = {
         "dependencies": [],
@@ -209,39 +383,44 @@ def analyze_dependencies(repo):
         "PHP": ["composer.json"],
         "Go": ["go.mod"]
     }
+    present_files = {name for name, kind in snapshot["root_entries"] if kind == "file"}
+    root_files = snapshot["root_files"]
     
     for lang, files in dependency_files.items():
         for file in files:
+            if file not in present_files:
+                continue
+            analysis["dependency_files"].append(file)
             try:
-                content = repo.get_contents(file)
-                analysis["dependency_files"].append(file)
-                if file == "requirements.txt":
-                    deps = content.decoded_content.decode().split("\n")
-                    analysis["dependencies"].extend([dep.strip() for dep in deps if dep.strip()])
-                elif file == "package.json":
-                    package_data = json.loads(content.decoded_content.decode())
+                if file == "requirements.txt" and root_files.get(file):
+                    analysis["dependencies"].extend(parse_requirements(root_files[file]))
+                elif file == "package.json" and root_files.get(file):
+                    package_data = json_loads(root_files[file])
                     analysis["dependencies"].extend(package_data.get("dependencies", {}).keys())
                     analysis["dependencies"].extend(package_data.get("devDependencies", {}).keys())
                 # Add more parsing logic for other dependency files as needed
-            except:
+            except ValueError:
                 pass
     
     return analysis
 
 def analyze_repo(repo):
     """Analyze the repository for contribution-related information."""
-    setup_info = get_setup_instructions(repo)
-    project_structure = identify_project_structure(repo)
-    file_analysis = analyze_repository_files(repo)
-    issue_pr_trends = analyze_issue_pr_trends(repo)
-    commit_history = analyze_commit_history(repo)
-    dependency_analysis = analyze_dependencies(repo)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        contributors = executor.submit(lambda: [c.login for c in repo.get_contributors()[:5]])
+        snapshot = get_repo_snapshot(repo)
+    setup_info = get_setup_instructions(snapshot)
+    project_structure = identify_project_structure(repo, snapshot)
+    file_analysis = analyze_repository_files(repo, snapshot)
+    issue_pr_trends = analyze_issue_pr_trends(snapshot)
+    commit_history = analyze_commit_history(snapshot)
+    dependency_analysis = analyze_dependencies(snapshot)
     
     analysis = {
         "name": repo.name,
         "description": repo.description,
         "language": repo.language,
-        "contributors": [c.login for c in repo.get_contributors()[:5]],
+        "contributors": contributors.result(),
         "setup_instructions": setup_info["setup_instructions"],
         "contribution_guidelines": setup_info["contribution_guidelines"],
         "project_structure": project_structure,
@@ -252,38 +431,80 @@ def analyze_repo(repo):
     }
     return analysis
 
-def get_open_issues(repo, labels=None, keywords=None, limit=10):
+def compile_keyword_pattern(keywords):
+    """Build one case-folded alternation so each issue is scanned once, whatever the keyword count."""
+    keywords = [keyword.lower() for keyword in keywords or []]
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+# GitHub search accepts at most five AND/OR/NOT operators per query
+SEARCH_MAX_KEYWORDS = 6
+
+def search_open_issues(repo, labels, keywords, limit):
+    """Let GitHub's issue search apply the label and keyword filters server-side, newest first like the listing."""
+    label_qualifiers = " ".join(f'label:"{label}"' for label in labels or [])
+    terms = " OR ".join('"' + keyword.replace('"', '') + '"' for keyword in keywords)
+    query = f"repo:{repo.full_name} is:issue is:open {label_qualifiers} in:title,body sort:created-desc {terms}"
+    return cached_search_issues(repo, query, limit=limit)
+
+def get_open_issues(repo, labels=None, keywords=None, limit=10, scan_limit=None):
     """
     Fetch open issues, filtered by labels and keywords, and scored for approachability.
+    Keywords match anywhere in the title or body. GitHub search is tried first (at most
+    scan_limit results, default limit * 3); it matches whole words only, so when it finds
+    fewer than limit issues the listing is scanned instead. A full search result can pass
+    over newer issues that contain a keyword only inside a longer word.
+    Returns (issue, score, label_names) tuples, most approachable first.
     """
-    issues = repo.get_issues(state='open', labels=labels)
+    scan_limit = scan_limit or limit * 3
+    keyword_re = compile_keyword_pattern(keywords)
     filtered_issues = []
-    
-    for issue in issues:
-        if len(filtered_issues) >= limit:
-            break
-        
-        # Filter by keywords if provided
-        if keywords and not any(keyword.lower() in issue.title.lower() or keyword.lower() in (issue.body or '').lower() for keyword in keywords):
-            continue
-        
+    now = datetime.now(timezone.utc)
+
+    def matching(issues):
+        return (
+            issue for issue in issues
+            if not keyword_re or keyword_re.search(f"{issue.title}\n{issue.body or ''}".lower())
+        )
+
+    candidates = None
+    if keywords and len(keywords) <= SEARCH_MAX_KEYWORDS:
+        try:
+            found = list(matching(search_open_issues(repo, labels, keywords, min(scan_limit, 100))))
+        except GithubException:
+            found = []
+        if len(found) >= limit:
+            candidates = found
+    if candidates is None:
+        # PyGithub sends an empty labels= filter for an empty list, so only pass real labels
+        issues = repo.get_issues(state='open', labels=labels) if labels else repo.get_issues(state='open')
+        # Only keyword matches count toward the limit, so a strict filter keeps paging until it fills
+        candidates = matching(issues)
+    for issue in islice(candidates, limit):
         # Score the issue for approachability
-        score = score_issue(issue)
+        label_names = tuple(label.name for label in issue.labels)
+        score = score_issue(issue, now, label_names)
         
-        filtered_issues.append((issue, score))
+        filtered_issues.append((issue, score, label_names))
     
     # Sort issues by score (higher is more approachable)
     return sorted(filtered_issues, key=lambda x: x[1], reverse=True)
 
-def score_issue(issue):
+_GOOD_LABELS = frozenset({'good first issue', 'help wanted'})
+
+def score_issue(issue, now=None, label_names=None):
     """
     Score an issue based on various factors to determine approachability.
     Higher score means more approachable.
     """
     score = 0
+    now = now or datetime.now(timezone.utc)
+    if label_names is None:
+        label_names = [label.name for label in issue.labels]
     
     # Prefer issues with 'good first issue' or 'help wanted' labels
-    if any(label.name.lower() in ['good first issue', 'help wanted'] for label in issue.labels):
+    if _GOOD_LABELS.intersection(name.lower() for name in label_names):
         score += 5
     
     # Prefer issues with clearer descriptions (longer, but not too long)
@@ -301,7 +522,7 @@ def score_issue(issue):
         score += 1
     
     # Prefer more recent issues
-    days_old = (datetime.now(issue.created_at.tzinfo) - issue.created_at).days
+    days_old = (now - issue.created_at).days
     if days_old < 30:
         score += 2
     elif days_old < 90:
@@ -309,40 +530,147 @@ def score_issue(issue):
     
     return score
 
-def analyze_issue(repo, issue):
-    """Analyze a single issue, including its context in the codebase."""
-    analysis = {
-        "title": issue.title or '',
-        "body": issue.body or '',
-        "labels": [l.name for l in issue.labels],
-        "comments": [comment.body or '' for comment in issue.get_comments()],
-        "mentioned_files": find_mentioned_files(issue.body or ''),
-    }
-    return analysis
-
 def find_mentioned_files(text):
     """Find files mentioned in the issue text. This is a simple implementation and could be improved."""
     if not text:
         return []
-    words = text.split()
-    return [word for word in words if '.' in word and '/' in word]
+    return _MENTIONED_FILE_RE.findall(text)
 
-def suggest_contribution(repo, issue):
+def suggest_contribution(repo, issue, label_names=None, mentioned_files=None):
     """Provide suggestions on how to approach solving the issue."""
-    suggestion = f"To contribute to issue #{issue.number}:\n"
-    suggestion += f"1. Read through the issue description and comments carefully.\n"
-    if issue.labels:
-        suggestion += f"2. Note that this issue is labeled as: {', '.join([l.name for l in issue.labels])}\n"
-    if find_mentioned_files(issue.body or ''):
-        suggestion += f"3. The issue mentions these files, which you should examine: {', '.join(find_mentioned_files(issue.body or ''))}\n"
-    suggestion += f"4. Set up the project locally using the provided setup instructions.\n"
-    suggestion += f"5. Create a new branch for your work.\n"
-    suggestion += f"6. Make your changes, commit them, and push to your fork.\n"
-    suggestion += f"7. Open a pull request referencing this issue.\n"
-    return suggestion
+    if label_names is None:
+        label_names = [l.name for l in issue.labels]
+    if mentioned_files is None:
+        mentioned_files = find_mentioned_files(issue.body or '')
+
+    lines = [
+        f"To contribute to issue #{issue.number}:",
+        "1. Read through the issue description and comments carefully.",
+    ]
+    if label_names:
+        lines.append(f"2. Note that this issue is labeled as: {', '.join(label_names)}")
+    if mentioned_files:
+        lines.append(f"3. The issue mentions these files, which you should examine: {', '.join(mentioned_files)}")
+    lines.extend([
+        "4. Set up the project locally using the provided setup instructions.",
+        "5. Create a new branch for your work.",
+        "6. Make your changes, commit them, and push to your fork.",
+        "7. Open a pull request referencing this issue.",
+    ])
+    return "\n".join(lines) + "\n"
+
+def render_contribution_guide(repo_analysis, issue_entries):
+    """
+    Render the contribution guide as one markdown document.
+    issue_entries holds (issue, score, label_names, contribution_suggestion) tuples.
+    """
+    parts = []
+    parts.append(f"# Contribution Guide for {repo_analysis['name']}\n\n")
+    parts.append(f"## Repository Analysis\n")
+    parts.append(f"- Name: {repo_analysis['name']}\n")
+    parts.append(f"- Description: {repo_analysis['description']}\n")
+    parts.append(f"- Primary Language: {repo_analysis['language']}\n")
+    parts.append(f"- Top Contributors: {', '.join(repo_analysis['contributors'])}\n\n")
+    
+    parts.append(f"## Setup Instructions\n")
+    parts.append(repo_analysis['setup_instructions'] or "No specific setup instructions found.\n")
+    parts.append("\n")
+    
+    parts.append(f"## Contribution Guidelines\n")
+    parts.append(repo_analysis['contribution_guidelines'] or "No specific contribution guidelines found.\n")
+    parts.append("\n")
+    
+    parts.append(f"## Project Structure\n")
+    parts.append(f"- Directories: {', '.join(repo_analysis['project_structure']['directories'])}\n")
+    parts.append(f"- Important Files: {', '.join(repo_analysis['project_structure']['important_files'])}\n")
+    parts.append(f"- Inferred Language: {repo_analysis['project_structure']['inferred_language']}\n")
+    parts.append("- Potential Coding Standards:\n")
+    for standard in repo_analysis['project_structure']['potential_standards']:
+        parts.append(f"  - {standard}\n")
+    parts.append("\n")
+
+    parts.append(f"## Repository File Analysis\n")
+    parts.append(f"### Community Health Files\n")
+    if repo_analysis['file_analysis']['community_health']:
+        parts.append(f"The following community health files are present:\n")
+        for file in repo_analysis['file_analysis']['community_health']:
+            parts.append(f"- {file}\n")
+    else:
+        parts.append(f"No community health files found.\n")
+    
+    parts.append(f"\n### CI/CD Configuration\n")
+    if repo_analysis['file_analysis']['ci_cd']:
+        parts.append(f"The following CI/CD configurations were detected:\n")
+        for ci_cd in repo_analysis['file_analysis']['ci_cd']:
+            parts.append(f"- {ci_cd}\n")
+    else:
+        parts.append(f"No CI/CD configuration detected.\n")
+    
+    parts.append(f"\n### Important Files\n")
+    if repo_analysis['file_analysis']['important_files']:
+        parts.append(f"The following important files are present:\n")
+        for file in repo_analysis['file_analysis']['important_files']:
+            parts.append(f"- {file}\n")
+    if 'gitignore_content' in repo_analysis['file_analysis']:
+        parts.append(f"\n.gitignore file content:\n```\n{repo_analysis['file_analysis']['gitignore_content']}\n```\n")
+    
+    parts.append(f"\n### Language-Specific Analysis\n")
+    if repo_analysis['file_analysis']['language_specific']:
+        parts.append(f"Primary language: {repo_analysis['file_analysis']['language_specific']['primary_language']}\n")
+        if 'python_files' in repo_analysis['file_analysis']['language_specific']:
+            parts.append(f"Python-specific files found: {', '.join(repo_analysis['file_analysis']['language_specific']['python_files'])}\n")
+        if 'package_json' in repo_analysis['file_analysis']['language_specific']:
+            parts.append(f"package.json found for JavaScript project.\n")
+    else:
+        parts.append(f"No language-specific information found.\n")
+    
+    parts.append("\n")
+    
+    parts.append(f"## Issue and Pull Request Trends\n")
+    parts.append(f"- Open Issues: {repo_analysis['issue_pr_trends']['issues']['open']}\n")
+    parts.append(f"- Closed Issues: {repo_analysis['issue_pr_trends']['issues']['closed']}\n")
+    parts.append(f"- Open Pull Requests: {repo_analysis['issue_pr_trends']['pull_requests']['open']}\n")
+    parts.append(f"- Merged Pull Requests: {repo_analysis['issue_pr_trends']['pull_requests']['merged']}\n")
+    parts.append(f"- Recent Issue Activity (last 30 days): {repo_analysis['issue_pr_trends']['issues']['recent_activity']}\n")
+    parts.append(f"- Recent PR Activity (last 30 days): {repo_analysis['issue_pr_trends']['pull_requests']['recent_activity']}\n")
+    if repo_analysis['issue_pr_trends']['avg_time_to_close_issues']:
+        parts.append(f"- Average Time to Close Issues: {repo_analysis['issue_pr_trends']['avg_time_to_close_issues']:.2f} days\n")
+    if repo_analysis['issue_pr_trends']['avg_time_to_merge_prs']:
+        parts.append(f"- Average Time to Merge PRs: {repo_analysis['issue_pr_trends']['avg_time_to_merge_prs']:.2f} days\n")
+    parts.append(f"- Top Issue Labels: {', '.join(repo_analysis['issue_pr_trends']['top_issue_labels'])}\n\n")
+    
+    parts.append(f"## Commit History Analysis\n")
+    parts.append(f"- Total Commits: {repo_analysis['commit_history']['total_commits']}\n")
+    parts.append(f"- Recent Commits (last 30 days): {repo_analysis['commit_history']['recent_commits']}\n")
+    parts.append(f"- Top Contributors: {', '.join(repo_analysis['commit_history']['top_contributors'])}\n")
+    if repo_analysis['commit_history']['commit_frequency']:
+        parts.append(f"- Commit Frequency: {repo_analysis['commit_history']['commit_frequency']:.2f} commits per day\n\n")
+    
+    parts.append(f"## Dependency Analysis\n")
+    parts.append(f"- Dependency Files Found: {', '.join(repo_analysis['dependency_analysis']['dependency_files'])}\n")
+    if repo_analysis['dependency_analysis']['dependencies']:
+        parts.append(f"- Dependencies:\n")
+        for dep in repo_analysis['dependency_analysis']['dependencies'][:10]:  # Limit to first 10 for brevity
+            parts.append(f"  - {dep}\n")
+        if len(repo_analysis['dependency_analysis']['dependencies']) > 10:
+            parts.append(f"  - ... and {len(repo_analysis['dependency_analysis']['dependencies']) - 10} more\n")
+    else:
+        parts.append(f"- No dependencies found or unable to parse dependency files.\n")
+    
+    parts.append("\n")
+
+    parts.append(f"## Open Issues (Sorted by Approachability)\n")
+    for issue, score, label_names, contribution_suggestion in issue_entries:
+        parts.append(f"### Issue #{issue.number}: {issue.title} (Score: {score})\n")
+        parts.append(f"Labels: {', '.join(label_names)}\n")
+        parts.append(f"Description: {(issue.body or '')[:100]}...\n")
+        parts.append(f"Contribution Suggestion:\n{contribution_suggestion}\n\n")
+
+    return "".join(parts)
 
 def main():
-    g = Github(os.getenv('GITHUB_TOKEN'))
+    # 100 per page: one request covers the issue scan, and bulk listings need fewer pages
+    g = create_github_client(per_page=100)
     repo_url = input("Please enter the GitHub repository URL: ")
     repo = g.get_repo(repo_url.split('github.com/')[-1])
 
@@ -359,109 +687,13 @@ def main():
     print("Fetching and analyzing open issues...")
     issues = get_open_issues(repo, labels=labels, keywords=keywords)
 
+    issue_entries = []
+    for issue, score, label_names in issues:
+        mentioned_files = find_mentioned_files(issue.body or '')
+        issue_entries.append((issue, score, label_names, suggest_contribution(repo, issue, label_names, mentioned_files)))
+
     with open("contribution_guide.md", "w") as f:
-        f.write(f"# Contribution Guide for {repo_analysis['name']}\n\n")
-        f.write(f"## Repository Analysis\n")
-        f.write(f"- Name: {repo_analysis['name']}\n")
-        f.write(f"- Description: {repo_analysis['description']}\n")
-        f.write(f"- Primary Language: {repo_analysis['language']}\n")
-        f.write(f"- Top Contributors: {', '.join(repo_analysis['contributors'])}\n\n")
-        
-        f.write(f"## Setup Instructions\n")
-        f.write(repo_analysis['setup_instructions'] or "No specific setup instructions found.\n")
-        f.write("\n")
-        
-        f.write(f"## Contribution Guidelines\n")
-        f.write(repo_analysis['contribution_guidelines'] or "No specific contribution guidelines found.\n")
-        f.write("\n")
-        
-        f.write(f"## Project Structure\n")
-        f.write(f"- Directories: {', '.join(repo_analysis['project_structure']['directories'])}\n")
-        f.write(f"- Important Files: {', '.join(repo_analysis['project_structure']['important_files'])}\n")
-        f.write(f"- Inferred Language: {repo_analysis['project_structure']['inferred_language']}\n")
-        f.write("- Potential Coding Standards:\n")
-        for standard in repo_analysis['project_structure']['potential_standards']:
-            f.write(f"  - {standard}\n")
-        f.write("\n")
-
-        f.write(f"## Repository File Analysis\n")
-        f.write(f"### Community Health Files\n")
-        if repo_analysis['file_analysis']['community_health']:
-            f.write(f"The following community health files are present:\n")
-            for file in repo_analysis['file_analysis']['community_health']:
-                f.write(f"- {file}\n")
-        else:
-            f.write(f"No community health files found.\n")
-        
-        f.write(f"\n### CI/CD Configuration\n")
-        if repo_analysis['file_analysis']['ci_cd']:
-            f.write(f"The following CI/CD configurations were detected:\n")
-            for ci_cd in repo_analysis['file_analysis']['ci_cd']:
-                f.write(f"- {ci_cd}\n")
-        else:
-            f.write(f"No CI/CD configuration detected.\n")
-        
-        f.write(f"\n### Important Files\n")
-        if repo_analysis['file_analysis']['important_files']:
-            f.write(f"The following important files are present:\n")
-            for file in repo_analysis['file_analysis']['important_files']:
-                f.write(f"- {file}\n")
-        if 'gitignore_content' in repo_analysis['file_analysis']:
-            f.write(f"\n.gitignore file content:\n```\n{repo_analysis['file_analysis']['gitignore_content']}\n```\n")
-        
-        f.write(f"\n### Language-Specific Analysis\n")
-        if repo_analysis['file_analysis']['language_specific']:
-            f.write(f"Primary language: {repo_analysis['file_analysis']['language_specific']['primary_language']}\n")
-            if 'python_files' in repo_analysis['file_analysis']['language_specific']:
-                f.write(f"Python-specific files found: {', '.join(repo_analysis['file_analysis']['language_specific']['python_files'])}\n")
-            if 'package_json' in repo_analysis['file_analysis']['language_specific']:
-                f.write(f"package.json found for JavaScript project.\n")
-        else:
-            f.write(f"No language-specific information found.\n")
-        
-        f.write("\n")
-        
-        f.write(f"## Issue and Pull Request Trends\n")
-        f.write(f"- Open Issues: {repo_analysis['issue_pr_trends']['issues']['open']}\n")
-        f.write(f"- Closed Issues: {repo_analysis['issue_pr_trends']['issues']['closed']}\n")
-        f.write(f"- Open Pull Requests: {repo_analysis['issue_pr_trends']['pull_requests']['open']}\n")
-        f.write(f"- Merged Pull Requests: {repo_analysis['issue_pr_trends']['pull_requests']['merged']}\n")
-        f.write(f"- Recent Issue Activity (last 30 days): {repo_analysis['issue_pr_trends']['issues']['recent_activity']}\n")
-        f.write(f"- Recent PR Activity (last 30 days): {repo_analysis['issue_pr_trends']['pull_requests']['recent_activity']}\n")
-        if repo_analysis['issue_pr_trends']['avg_time_to_close_issues']:
-            f.write(f"- Average Time to Close Issues: {repo_analysis['issue_pr_trends']['avg_time_to_close_issues']:.2f} days\n")
-        if repo_analysis['issue_pr_trends']['avg_time_to_merge_prs']:
-            f.write(f"- Average Time to Merge PRs: {repo_analysis['issue_pr_trends']['avg_time_to_merge_prs']:.2f} days\n")
-        f.write(f"- Top Issue Labels: {', '.join(repo_analysis['issue_pr_trends']['top_issue_labels'])}\n\n")
-        
-        f.write(f"## Commit History Analysis\n")
-        f.write(f"- Total Commits: {repo_analysis['commit_history']['total_commits']}\n")
-        f.write(f"- Recent Commits (last 30 days): {repo_analysis['commit_history']['recent_commits']}\n")
-        f.write(f"- Top Contributors: {', '.join(repo_analysis['commit_history']['top_contributors'])}\n")
-        if repo_analysis['commit_history']['commit_frequency']:
-            f.write(f"- Commit Frequency: {repo_analysis['commit_history']['commit_frequency']:.2f} commits per day\n\n")
-        
-        f.write(f"## Dependency Analysis\n")
-        f.write(f"- Dependency Files Found: {', '.join(repo_analysis['dependency_analysis']['dependency_files'])}\n")
-        if repo_analysis['dependency_analysis']['dependencies']:
-            f.write(f"- Dependencies:\n")
-            for dep in repo_analysis['dependency_analysis']['dependencies'][:10]:  # Limit to first 10 for brevity
-                f.write(f"  - {dep}\n")
-            if len(repo_analysis['dependency_analysis']['dependencies']) > 10:
-                f.write(f"  - ... and {len(repo_analysis['dependency_analysis']['dependencies']) - 10} more\n")
-        else:
-            f.write(f"- No dependencies found or unable to parse dependency files.\n")
-        
-        f.write("\n")
-
-        f.write(f"## Open Issues (Sorted by Approachability)\n")
-        for issue, score in issues:
-            issue_analysis = analyze_issue(repo, issue)
-            contribution_suggestion = suggest_contribution(repo, issue)
-            f.write(f"### Issue #{issue.number}: {issue.title} (Score: {score})\n")
-            f.write(f"Labels: {', '.join([label.name for label in issue.labels])}\n")
-            f.write(f"Description: {(issue.body or '')[:100]}...\n")
-            f.write(f"Contribution Suggestion:\n{contribution_suggestion}\n\n")
+        f.write(render_contribution_guide(repo_analysis, issue_entries))
 
     print("Analysis complete. Results written to contribution_guide.md")
 
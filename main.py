@@ -1,10 +1,9 @@
-import os
-from github import Github
+from github_auth import create_github_client
 from repo_analyzer import RepoAnalyzer
 from issue_analyzer import get_open_issues, analyze_issue
 
 def main():
-    g = Github(os.getenv('GITHUB_TOKEN'))
+    g = create_github_client(per_page=100)
     repo_url = input("Please enter the GitHub repository URL: ")
     repo = g.get_repo(repo_url.split('github.com/')[-1])
 
@@ -21,8 +20,8 @@ def main():
     print("Fetching and analyzing open issues...")
     issues = get_open_issues(repo, labels=labels, keywords=keywords, issue_templates=repo_analysis['issue_templates'])
 
-    with open("contribution_guide.md", "w") as f:
-        f.write(analyzer.generate_markdown())
+    with open("contribution_guide.md", "w", buffering=1 << 16) as f:
+        analyzer.write_markdown(f)
 
         f.write(f"## Open Issues (Sorted by Approachability)\n")
         for issue, score in issues:
@@ -1,33 +1,173 @@
+import io
+import os
 import re
 import json
-import base64
+import time
 import ast
 from collections import Counter
-from datetime import datetime, timedelta
-from utils import extract_section
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from github import GithubException
+from github_cache import cached_get_contents, cached_get_git_tree, cached_list_directory, cached_search_count
+from utils import extract_sections
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional; without it only Markdown issue templates are read
+    yaml = None
+
+# Concurrent sub-analyses; kept low to stay clear of GitHub's secondary rate limits
+ANALYSIS_WORKERS = 10
+
+# Parallel file downloads within a single sub-analysis
+FILE_FETCH_WORKERS = 8
+
+# Larger Python files are counted but not parsed for complexity
+MAX_PARSE_SIZE = 200 * 1024
+
+# Upper bounds on the listings sampled for recent activity, close times and top labels and
+# contributors, most recently updated first; totals come from exact counts instead
+ISSUE_SCAN_LIMIT = 2000
+COMMIT_SCAN_LIMIT = 1000
+RECENT_ACTIVITY_DAYS = 30
+
+# Exact issue and pull request totals, read from the search API's total_count
+TREND_COUNT_QUERIES = {
+    ("issues", "open"): "is:issue is:open",
+    ("issues", "closed"): "is:issue is:closed",
+    ("pull_requests", "open"): "is:pr is:open",
+    ("pull_requests", "closed"): "is:pr is:closed is:unmerged",
+    ("pull_requests", "merged"): "is:pr is:merged",
+}
+
+# Saved analyses live next to the API cache when ISSUE_CONTRIBUTOR_CACHE_DIR is set
+_cache_dir = os.getenv("ISSUE_CONTRIBUTOR_CACHE_DIR")
+ANALYSIS_CACHE_DIR = os.path.join(os.path.expanduser(_cache_dir), "analysis") if _cache_dir else None
+
+# An unchanged head is trusted for this long; issue and PR trends move without pushes
+ANALYSIS_MAX_AGE = 60 * 60  # seconds
+
+_SETUP_SECTIONS = {
+    "setup_instructions": "installation|setup|getting started",
+    "contribution_guidelines": "contributing|how to contribute"
+}
+
+_TEMPLATE_SECTION_RE = re.compile(r'^##\s+', re.MULTILINE)
+
+class _ComplexityVisitor(ast.NodeVisitor):
+    """Collects the cyclomatic complexity of every function in a single traversal."""
+
+    def __init__(self):
+        self.complexities = []
+        self._enclosing = []
+
+    def visit_FunctionDef(self, node):
+        self._enclosing.append(len(self.complexities))
+        self.complexities.append(1)
+        self.generic_visit(node)
+        self._enclosing.pop()
+
+    def visit_branch(self, node):
+        # A nested function's branches also count toward the functions enclosing it
+        for index in self._enclosing:
+            self.complexities[index] += 1
+        self.generic_visit(node)
+
+    visit_If = visit_While = visit_For = visit_BoolOp = visit_branch
 
 class RepoAnalyzer:
     def __init__(self, repo):
         self.repo = repo
         self.analysis = {}
+        # One recursive listing answers every "does this file exist" question below
+        self._tree = cached_get_git_tree(self.repo)
+        if self._tree is None:
+            # Truncated listing: every path below lives in one of these directories
+            self._tree = [entry for directory in ("", ".github", ".github/ISSUE_TEMPLATE") for entry in cached_list_directory(self.repo, directory)]
+        self._tree_paths = {entry.path: entry.sha for entry in self._tree}
+        self._root_entries = [entry for entry in self._tree if "/" not in entry.path]
+        # Results from the previous run, reused for files whose blob SHA is unchanged
+        self._previous = {}
+        self._file_results = {}
+        self._dependency_shas = {}
+        self._texts = {}
 
     def analyze(self):
-        self.analysis = {
-            "name": self.repo.name,
-            "description": self.repo.description,
-            "language": self.repo.language,
-            "contributors": [c.login for c in self.repo.get_contributors()[:5]],
-            "setup_instructions": self.get_setup_instructions(),
-            "project_structure": self.identify_project_structure(),
-            "file_analysis": self.analyze_repository_files(),
-            "issue_pr_trends": self.analyze_issue_pr_trends(),
-            "commit_history": self.analyze_commit_history(),
-            "dependency_analysis": self.analyze_dependencies(),
-            "code_complexity": self.estimate_code_complexity(),
-            "issue_templates": self.analyze_issue_templates()
+        head_sha = None
+        if ANALYSIS_CACHE_DIR:
+            head_sha = self.repo.get_branch(self.repo.default_branch).commit.sha
+            self._previous = self._load_saved_analysis()
+            if self._previous.get("head_sha") == head_sha and time.time() - self._previous.get("timestamp", 0) < ANALYSIS_MAX_AGE:
+                self.analysis = self._previous["analysis"]
+                return self.analysis
+
+        # The sub-analyses are independent and network-bound, so they run side by side
+        tasks = {
+            "contributors": lambda: [c.login for c in self.repo.get_contributors()[:5]],
+            "setup_instructions": self.get_setup_instructions,
+            "project_structure": self.identify_project_structure,
+            "file_analysis": self.analyze_repository_files,
+            "issue_pr_trends": self.analyze_issue_pr_trends,
+            "commit_history": self.analyze_commit_history,
+            "dependency_analysis": self.analyze_dependencies,
+            "code_complexity": self.estimate_code_complexity,
+            "issue_templates": self.analyze_issue_templates
         }
+        with ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS) as executor:
+            futures = {key: executor.submit(task) for key, task in tasks.items()}
+            self.analysis = {
+                "name": self.repo.name,
+                "description": self.repo.description,
+                "language": self.repo.language,
+                **{key: future.result() for key, future in futures.items()}
+            }
+        if ANALYSIS_CACHE_DIR:
+            self._save_analysis(head_sha)
         return self.analysis
 
+    def _analysis_cache_path(self):
+        return os.path.join(ANALYSIS_CACHE_DIR, f"{self.repo.full_name.replace('/', '_')}.json")
+
+    def _load_saved_analysis(self):
+        try:
+            with open(self._analysis_cache_path()) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # A file of the wrong shape is treated like a missing one
+        if not isinstance(saved, dict) or not all(isinstance(saved.get(key), dict) for key in ("analysis", "file_results", "dependency_shas")):
+            return {}
+        return saved
+
+    def _save_analysis(self, head_sha):
+        saved = {
+            "timestamp": time.time(),
+            "head_sha": head_sha,
+            "analysis": self.analysis,
+            "file_results": self._file_results,
+            "dependency_shas": self._dependency_shas
+        }
+        tmp_path = f"{self._analysis_cache_path()}.tmp"
+        # The saved analysis is only a shortcut for the next run, so failing to write it is not an error
+        try:
+            os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(saved, f)
+            os.replace(tmp_path, self._analysis_cache_path())
+        except (TypeError, ValueError, OSError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _read_text(self, path):
+        # Some files (package.json) are read by more than one sub-analysis; decode each one once
+        text = self._texts.get(path)
+        if text is None:
+            text = self._texts[path] = cached_get_contents(self.repo, path).decoded_content.decode('utf-8')
+        return text
+
     def get_setup_instructions(self):
         files_to_check = ["README.md", "CONTRIBUTING.md", "SETUP.md", "CONTRIBUTE.md"]
         setup_info = {
@@ -35,16 +175,24 @@ class RepoAnalyzer:
             "contribution_guidelines": "",
         }
         
-        for file_name in files_to_check:
+        def read(file_name):
             try:
-                content = self.repo.get_contents(file_name).decoded_content.decode('utf-8')
-                setup_info["setup_instructions"] = extract_section(content, "installation|setup|getting started")
-                setup_info["contribution_guidelines"] = extract_section(content, "contributing|how to contribute")
-                
-                if setup_info["setup_instructions"] and setup_info["contribution_guidelines"]:
-                    break
-            except:
+                return self._read_text(file_name)
+            except (GithubException, UnicodeDecodeError):
+                return None
+
+        # Fetch every present file at once rather than one round trip per file
+        present = [file_name for file_name in files_to_check if file_name in self._tree_paths]
+        with ThreadPoolExecutor(max_workers=FILE_FETCH_WORKERS) as executor:
+            contents = list(executor.map(read, present))
+        
+        for content in contents:
+            if content is None:
                 continue
+            setup_info.update(extract_sections(content, _SETUP_SECTIONS))
+            
+            if setup_info["setup_instructions"] and setup_info["contribution_guidelines"]:
+                break
         
         return setup_info
 
@@ -56,14 +204,13 @@ class RepoAnalyzer:
             "potential_standards": []
         }
         
-        contents = self.repo.get_contents("")
-        for content in contents:
-            if content.type == "dir":
-                structure["directories"].append(content.name)
-            elif content.type == "file":
-                if content.name in [".editorconfig", ".pylintrc", "tox.ini", "setup.cfg"]:
-                    structure["important_files"].append(content.name)
-                    structure["potential_standards"].append(f"Possible use of {content.name} for code style")
+        for entry in self._root_entries:
+            if entry.type == "tree":
+                structure["directories"].append(entry.path)
+            elif entry.type == "blob":
+                if entry.path in [".editorconfig", ".pylintrc", "tox.ini", "setup.cfg"]:
+                    structure["important_files"].append(entry.path)
+                    structure["potential_standards"].append(f"Possible use of {entry.path} for code style")
         
         if "tests" in structure["directories"]:
             structure["potential_standards"].append("Presence of a 'tests' directory suggests unit testing is used")
@@ -84,36 +231,33 @@ class RepoAnalyzer:
         ci_cd_files = [".travis.yml", ".github/workflows", "azure-pipelines.yml", "Jenkinsfile", ".gitlab-ci.yml"]
         important_files = [".gitignore", "README.md", "LICENSE"]
         
-        contents = self.repo.get_contents("")
-        for content in contents:
-            if content.type == "file":
-                if content.name in community_files:
-                    analysis["community_health"].append(content.name)
-                elif content.name in ci_cd_files or (content.name == "workflows" and content.path == ".github/workflows"):
-                    analysis["ci_cd"].append(content.name)
-                elif content.name in important_files:
-                    analysis["important_files"].append(content.name)
-                    if content.name == ".gitignore":
-                        analysis["gitignore_content"] = base64.b64decode(content.content).decode('utf-8')
-            elif content.type == "dir" and content.path == ".github/workflows":
-                analysis["ci_cd"].append("GitHub Actions")
+        for entry in self._root_entries:
+            if entry.type == "blob":
+                if entry.path in community_files:
+                    analysis["community_health"].append(entry.path)
+                elif entry.path in ci_cd_files:
+                    analysis["ci_cd"].append(entry.path)
+                elif entry.path in important_files:
+                    analysis["important_files"].append(entry.path)
+                    if entry.path == ".gitignore":
+                        try:
+                            analysis["gitignore_content"] = self._read_text(entry.path)
+                        except (GithubException, UnicodeDecodeError):
+                            pass
+        if ".github/workflows" in self._tree_paths:
+            analysis["ci_cd"].append("GitHub Actions")
         
         if self.repo.language:
             analysis["language_specific"]["primary_language"] = self.repo.language
             if self.repo.language.lower() == "python":
                 python_files = ["requirements.txt", "setup.py", "Pipfile"]
-                for file in python_files:
-                    try:
-                        self.repo.get_contents(file)
-                        analysis["language_specific"]["python_files"] = analysis["language_specific"].get("python_files", []) + [file]
-                    except:
-                        pass
-            elif self.repo.language.lower() == "javascript":
+                found = [file for file in python_files if file in self._tree_paths]
+                if found:
+                    analysis["language_specific"]["python_files"] = found
+            elif self.repo.language.lower() == "javascript" and "package.json" in self._tree_paths:
                 try:
-                    package_json = self.repo.get_contents("package.json")
-                    package_content = base64.b64decode(package_json.content).decode('utf-8')
-                    analysis["language_specific"]["package_json"] = package_content
-                except:
+                    analysis["language_specific"]["package_json"] = self._read_text("package.json")
+                except (GithubException, UnicodeDecodeError):
                     pass
         
         return analysis
@@ -127,34 +271,30 @@ class RepoAnalyzer:
             "avg_time_to_merge_prs": None
         }
         
-        issues = self.repo.get_issues(state='all')
+        with ThreadPoolExecutor(max_workers=len(TREND_COUNT_QUERIES)) as executor:
+            counts = {key: executor.submit(cached_search_count, self.repo, qualifiers) for key, qualifiers in TREND_COUNT_QUERIES.items()}
+            for (group, state), count in counts.items():
+                analysis[group][state] = count.result()
+        
+        cutoff = datetime.now(timezone.utc) - timedelta(days=RECENT_ACTIVITY_DAYS)
+        issues = islice(self.repo.get_issues(state='all', sort='updated', direction='desc'), ISSUE_SCAN_LIMIT)
         issue_close_times = []
         label_counter = Counter()
         for issue in issues:
             if issue.pull_request is None:  # Exclude PRs from issue count
-                if issue.state == 'open':
-                    analysis["issues"]["open"] += 1
-                else:
-                    analysis["issues"]["closed"] += 1
-                    if issue.closed_at:
-                        issue_close_times.append((issue.closed_at - issue.created_at).total_seconds())
-                if datetime.now(issue.updated_at.tzinfo) - issue.updated_at < timedelta(days=30):
+                if issue.state != 'open' and issue.closed_at:
+                    issue_close_times.append((issue.closed_at - issue.created_at).total_seconds())
+                if issue.updated_at > cutoff:
                     analysis["issues"]["recent_activity"] += 1
-                for label in issue.labels:
-                    label_counter[label.name] += 1
+                label_counter.update(label.name for label in issue.labels)
         
-        pulls = self.repo.get_pulls(state='all')
+        pulls = islice(self.repo.get_pulls(state='all', sort='updated', direction='desc'), ISSUE_SCAN_LIMIT)
         pr_merge_times = []
         for pr in pulls:
-            if pr.state == 'open':
-                analysis["pull_requests"]["open"] += 1
-            elif pr.merged:
-                analysis["pull_requests"]["merged"] += 1
-                if pr.merged_at:
-                    pr_merge_times.append((pr.merged_at - pr.created_at).total_seconds())
-            else:
-                analysis["pull_requests"]["closed"] += 1
-            if datetime.now(pr.updated_at.tzinfo) - pr.updated_at < timedelta(days=30):
+            # merged_at is in the list payload; pr.merged would fetch each PR again
+            if pr.merged_at is not None:
+                pr_merge_times.append((pr.merged_at - pr.created_at).total_seconds())
+            if pr.updated_at > cutoff:
                 analysis["pull_requests"]["recent_activity"] += 1
         
         if issue_close_times:
@@ -174,20 +314,19 @@ class RepoAnalyzer:
             "commit_frequency": None
         }
         
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=RECENT_ACTIVITY_DAYS)
         commits = self.repo.get_commits()
-        contributor_counter = Counter()
-        
-        for commit in commits:
-            analysis["total_commits"] += 1
-            if datetime.now(commit.commit.author.date.tzinfo) - commit.commit.author.date < timedelta(days=30):
-                analysis["recent_commits"] += 1
-            if commit.author:
-                contributor_counter[commit.author.login] += 1
-        
+        analysis["total_commits"] = commits.totalCount
+        analysis["recent_commits"] = self.repo.get_commits(since=cutoff).totalCount
+        contributor_counter = Counter(commit.author.login for commit in islice(commits, COMMIT_SCAN_LIMIT) if commit.author)
         analysis["top_contributors"] = [contributor for contributor, _ in contributor_counter.most_common(5)]
         
-        if analysis["total_commits"] > 0:
-            days_since_first_commit = (datetime.now(commits[analysis["total_commits"]-1].commit.author.date.tzinfo) - commits[analysis["total_commits"]-1].commit.author.date).days
+        if analysis["total_commits"]:
+            # Commits are listed newest first, so only the last page is needed for the first commit
+            last_page = -(-analysis["total_commits"] // self.repo.requester.per_page) - 1
+            first_commit_date = commits.get_page(last_page)[-1].commit.author.date
+            days_since_first_commit = (now - first_commit_date).days
             analysis["commit_frequency"] = analysis["total_commits"] / max(days_since_first_commit, 1)
         
         return analysis
@@ -207,19 +346,26 @@ class RepoAnalyzer:
             "Go": ["go.mod"]
         }
         
+        self._dependency_shas = {
+            file: self._tree_paths[file] for files in dependency_files.values() for file in files if file in self._tree_paths
+        }
+        if self._previous.get("dependency_shas") == self._dependency_shas and "dependency_analysis" in self._previous["analysis"]:
+            return self._previous["analysis"]["dependency_analysis"]
+        
         for lang, files in dependency_files.items():
             for file in files:
+                if file not in self._tree_paths:
+                    continue
+                analysis["dependency_files"].append(file)
                 try:
-                    content = self.repo.get_contents(file)
-                    analysis["dependency_files"].append(file)
                     if file == "requirements.txt":
-                        deps = content.decoded_content.decode().split("\n")
+                        deps = self._read_text(file).split("\n")
                         analysis["dependencies"].extend([dep.strip() for dep in deps if dep.strip()])
                     elif file == "package.json":
-                        package_data = json.loads(content.decoded_content.decode())
+                        package_data = json.loads(self._read_text(file))
                         analysis["dependencies"].extend(package_data.get("dependencies", {}).keys())
                         analysis["dependencies"].extend(package_data.get("devDependencies", {}).keys())
-                except:
+                except (GithubException, ValueError):
                     pass
         
         return analysis
@@ -232,168 +378,202 @@ class RepoAnalyzer:
             "files_analyzed": 0
         }
 
-        for content_file in self.repo.get_contents(""):
-            if content_file.type == "file" and content_file.name.endswith(".py"):
-                try:
-                    file_content = self.repo.get_contents(content_file.path).decoded_content.decode('utf-8')
-                    complexity["total_lines"] += len(file_content.splitlines())
-                    
-                    tree = ast.parse(file_content)
-                    functions = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-                    complexity["total_functions"] += len(functions)
-                    
-                    file_complexity = sum(self.calculate_cyclomatic_complexity(func) for func in functions)
-                    if functions:
-                        complexity["avg_function_complexity"] += file_complexity / len(functions)
-                    
-                    complexity["files_analyzed"] += 1
-                except Exception as e:
-                    print(f"Error analyzing file {content_file.name}: {str(e)}")
+        py_paths = [entry.path for entry in self._root_entries if entry.type == "blob" and entry.path.endswith(".py")]
+        # Fetching dominates parsing, so the files are downloaded in parallel and tallied in order
+        with ThreadPoolExecutor(max_workers=FILE_FETCH_WORKERS) as executor:
+            results = list(executor.map(self._analyze_python_file, py_paths))
+
+        for result in results:
+            if result is None:
+                continue
+            lines, function_count, avg_complexity = result
+            complexity["total_lines"] += lines
+            if avg_complexity is None:
+                continue
+            complexity["total_functions"] += function_count
+            complexity["avg_function_complexity"] += avg_complexity
+            complexity["files_analyzed"] += 1
 
         if complexity["files_analyzed"] > 0:
             complexity["avg_function_complexity"] /= complexity["files_analyzed"]
 
         return complexity
 
-    def calculate_cyclomatic_complexity(self, func):
-        complexity = 1
-        for node in ast.walk(func):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.And, ast.Or)):
-                complexity += 1
-        return complexity
+    def _analyze_python_file(self, path):
+        sha = self._tree_paths[path]
+        previous = self._previous.get("file_results", {}).get(path)
+        if isinstance(previous, dict) and previous.get("sha") == sha and isinstance(previous.get("result"), list):
+            self._file_results[path] = previous
+            return tuple(previous["result"])
+        try:
+            file_content = self._read_text(path)
+            lines = file_content.count('\n') + (bool(file_content) and not file_content.endswith('\n'))
+            if len(file_content) > MAX_PARSE_SIZE:
+                # A few huge (often generated) files barely move the average, so only their lines count
+                result = (lines, 0, None)
+            else:
+                visitor = _ComplexityVisitor()
+                visitor.visit(ast.parse(file_content))
+                functions = visitor.complexities
+                result = (lines, len(functions), sum(functions) / len(functions) if functions else 0)
+        except Exception as e:
+            print(f"Error analyzing file {path}: {str(e)}")
+            return None
+        self._file_results[path] = {"sha": sha, "result": result}
+        return result
 
     def analyze_issue_templates(self):
         templates = {}
-        template_dir = '.github/ISSUE_TEMPLATE'
-        
-        try:
-            contents = self.repo.get_contents(template_dir)
-            for content in contents:
-                if content.type == "file" and (content.name.endswith('.md') or content.name.endswith('.yml')):
-                    template_content = base64.b64decode(content.content).decode('utf-8')
-                    if content.name.endswith('.md'):
-                        sections = re.split(r'^##\s+', template_content, flags=re.MULTILINE)[1:]
-                        templates[content.name] = {section.split('\n', 1)[0]: section.split('\n', 1)[1].strip() for section in sections}
-                    elif content.name.endswith('.yml'):
-                        yaml_content = yaml.safe_load(template_content)
-                        templates[content.name] = {field['attributes']['label']: field['attributes']['description'] for field in yaml_content.get('body', []) if 'attributes' in field}
-        except:
-            pass
-        
-        return templates
+        template_dir = '.github/ISSUE_TEMPLATE/'
+        template_paths = [
+            entry.path for entry in self._tree
+            if entry.type == "blob" and entry.path.startswith(template_dir) and "/" not in entry.path[len(template_dir):]
+        ]
+        
+        for path in template_paths:
+            name = path[len(template_dir):]
+            # config.yml configures the template chooser and is not a template itself
+            if name == 'config.yml' or not (name.endswith('.md') or (name.endswith('.yml') and yaml is not None)):
+                continue
+            try:
+                template_content = self._read_text(path)
+            except (GithubException, UnicodeDecodeError):
+                continue
+            if name.endswith('.md'):
+                sections = [section.partition('\n') for section in _TEMPLATE_SECTION_RE.split(template_content)[1:]]
+                templates[name] = {title: body.strip() for title, _, body in sections}
+            else:
+                try:
+                    yaml_content = yaml.safe_load(template_content)
+                except yaml.YAMLError:
+                    continue
+                fields = (yaml_content.get('body') or []) if isinstance(yaml_content, dict) else []
+                # Only input fields carry a label; markdown blocks only have a value
+                attributes = [field.get('attributes') for field in fields if isinstance(field, dict)]
+                templates[name] = {
+                    attrs['label']: attrs.get('description', '')
+                    for attrs in attributes if isinstance(attrs, dict) and 'label' in attrs
+                }
+        
+        # A template without sections would match every issue body
+        return {name: sections for name, sections in templates.items() if sections}
 
     def generate_markdown(self):
-        md = f"# Contribution Guide for {self.analysis['name']}\n\n"
-        
-        md += f"## Repository Analysis\n"
-        md += f"- Name: {self.analysis['name']}\n"
-        md += f"- Description: {self.analysis['description']}\n"
-        md += f"- Primary Language: {self.analysis['language']}\n"
-        md += f"- Top Contributors: {', '.join(self.analysis['contributors'])}\n\n"
-        
-        md += f"## Setup Instructions\n"
-        md += self.analysis['setup_instructions']['setup_instructions'] or "No specific setup instructions found.\n"
-        md += "\n"
-        
-        md += f"## Contribution Guidelines\n"
-        md += self.analysis['setup_instructions']['contribution_guidelines'] or "No specific contribution guidelines found.\n"
-        md += "\n"
-        
-        md += f"## Project Structure\n"
-        md += f"- Directories: {', '.join(self.analysis['project_structure']['directories'])}\n"
-        md += f"- Important Files: {', '.join(self.analysis['project_structure']['important_files'])}\n"
-        md += f"- Inferred Language: {self.analysis['project_structure']['inferred_language']}\n"
-        md += "- Potential Coding Standards:\n"
+        buffer = io.StringIO()
+        self.write_markdown(buffer)
+        return buffer.getvalue()
+
+    def write_markdown(self, f):
+        write = f.write
+        write(f"# Contribution Guide for {self.analysis['name']}\n\n")
+        
+        write(f"## Repository Analysis\n")
+        write(f"- Name: {self.analysis['name']}\n")
+        write(f"- Description: {self.analysis['description']}\n")
+        write(f"- Primary Language: {self.analysis['language']}\n")
+        write(f"- Top Contributors: {', '.join(self.analysis['contributors'])}\n\n")
+        
+        write(f"## Setup Instructions\n")
+        write(self.analysis['setup_instructions']['setup_instructions'] or "No specific setup instructions found.\n")
+        write("\n")
+        
+        write(f"## Contribution Guidelines\n")
+        write(self.analysis['setup_instructions']['contribution_guidelines'] or "No specific contribution guidelines found.\n")
+        write("\n")
+        
+        write(f"## Project Structure\n")
+        write(f"- Directories: {', '.join(self.analysis['project_structure']['directories'])}\n")
+        write(f"- Important Files: {', '.join(self.analysis['project_structure']['important_files'])}\n")
+        write(f"- Inferred Language: {self.analysis['project_structure']['inferred_language']}\n")
+        write("- Potential Coding Standards:\n")
         for standard in self.analysis['project_structure']['potential_standards']:
-            md += f"  - {standard}\n"
-        md += "\n"
+            write(f"  - {standard}\n")
+        write("\n")
 
-        md += f"## Repository File Analysis\n"
-        md += f"### Community Health Files\n"
+        write(f"## Repository File Analysis\n")
+        write(f"### Community Health Files\n")
         if self.analysis['file_analysis']['community_health']:
-            md += f"The following community health files are present:\n"
+            write(f"The following community health files are present:\n")
             for file in self.analysis['file_analysis']['community_health']:
-                md += f"- {file}\n"
+                write(f"- {file}\n")
         else:
-            md += f"No community health files found.\n"
+            write(f"No community health files found.\n")
         
-        md += f"\n### CI/CD Configuration\n"
+        write(f"\n### CI/CD Configuration\n")
         if self.analysis['file_analysis']['ci_cd']:
-            md += f"The following CI/CD configurations were detected:\n"
+            write(f"The following CI/CD configurations were detected:\n")
             for ci_cd in self.analysis['file_analysis']['ci_cd']:
-                md += f"- {ci_cd}\n"
+                write(f"- {ci_cd}\n")
         else:
-            md += f"No CI/CD configuration detected.\n"
+            write(f"No CI/CD configuration detected.\n")
         
-        md += f"\n### Important Files\n"
+        write(f"\n### Important Files\n")
         if self.analysis['file_analysis']['important_files']:
-            md += f"The following important files are present:\n"
+            write(f"The following important files are present:\n")
             for file in self.analysis['file_analysis']['important_files']:
-                md += f"- {file}\n"
+                write(f"- {file}\n")
         if 'gitignore_content' in self.analysis['file_analysis']:
-            md += f"\n.gitignore file content:\n```\n{self.analysis['file_analysis']['gitignore_content']}\n```\n"
+            write(f"\n.gitignore file content:\n```\n{self.analysis['file_analysis']['gitignore_content']}\n```\n")
         
-        md += f"\n### Language-Specific Analysis\n"
+        write(f"\n### Language-Specific Analysis\n")
         if self.analysis['file_analysis']['language_specific']:
-            md += f"Primary language: {self.analysis['file_analysis']['language_specific']['primary_language']}\n"
+            write(f"Primary language: {self.analysis['file_analysis']['language_specific']['primary_language']}\n")
             if 'python_files' in self.analysis['file_analysis']['language_specific']:
-                md += f"Python-specific files found: {', '.join(self.analysis['file_analysis']['language_specific']['python_files'])}\n"
+                write(f"Python-specific files found: {', '.join(self.analysis['file_analysis']['language_specific']['python_files'])}\n")
             if 'package_json' in self.analysis['file_analysis']['language_specific']:
-                md += f"package.json found for JavaScript project.\n"
+                write(f"package.json found for JavaScript project.\n")
         else:
-            md += f"No language-specific information found.\n"
+            write(f"No language-specific information found.\n")
         
-        md += "\n"
+        write("\n")
         
-        md += f"## Issue and Pull Request Trends\n"
-        md += f"- Open Issues: {self.analysis['issue_pr_trends']['issues']['open']}\n"
-        md += f"- Closed Issues: {self.analysis['issue_pr_trends']['issues']['closed']}\n"
-        md += f"- Open Pull Requests: {self.analysis['issue_pr_trends']['pull_requests']['open']}\n"
-        md += f"- Merged Pull Requests: {self.analysis['issue_pr_trends']['pull_requests']['merged']}\n"
-        md += f"- Recent Issue Activity (last 30 days): {self.analysis['issue_pr_trends']['issues']['recent_activity']}\n"
-        md += f"- Recent PR Activity (last 30 days): {self.analysis['issue_pr_trends']['pull_requests']['recent_activity']}\n"
+        write(f"## Issue and Pull Request Trends\n")
+        write(f"- Open Issues: {self.analysis['issue_pr_trends']['issues']['open']}\n")
+        write(f"- Closed Issues: {self.analysis['issue_pr_trends']['issues']['closed']}\n")
+        write(f"- Open Pull Requests: {self.analysis['issue_pr_trends']['pull_requests']['open']}\n")
+        write(f"- Merged Pull Requests: {self.analysis['issue_pr_trends']['pull_requests']['merged']}\n")
+        write(f"- Recent Issue Activity (last 30 days): {self.analysis['issue_pr_trends']['issues']['recent_activity']}\n")
+        write(f"- Recent PR Activity (last 30 days): {self.analysis['issue_pr_trends']['pull_requests']['recent_activity']}\n")
         if self.analysis['issue_pr_trends']['avg_time_to_close_issues']:
-            md += f"- Average Time to Close Issues: {self.analysis['issue_pr_trends']['avg_time_to_close_issues']:.2f} days\n"
+            write(f"- Average Time to Close Issues: {self.analysis['issue_pr_trends']['avg_time_to_close_issues']:.2f} days\n")
         if self.analysis['issue_pr_trends']['avg_time_to_merge_prs']:
-            md += f"- Average Time to Merge PRs: {self.analysis['issue_pr_trends']['avg_time_to_merge_prs']:.2f} days\n"
-        md += f"- Top Issue Labels: {', '.join(self.analysis['issue_pr_trends']['top_issue_labels'])}\n\n"
+            write(f"- Average Time to Merge PRs: {self.analysis['issue_pr_trends']['avg_time_to_merge_prs']:.2f} days\n")
+        write(f"- Top Issue Labels: {', '.join(self.analysis['issue_pr_trends']['top_issue_labels'])}\n\n")
         
-        md += f"## Commit History Analysis\n"
-        md += f"- Total Commits: {self.analysis['commit_history']['total_commits']}\n"
-        md += f"- Recent Commits (last 30 days): {self.analysis['commit_history']['recent_commits']}\n"
-        md += f"- Top Contributors: {', '.join(self.analysis['commit_history']['top_contributors'])}\n"
+        write(f"## Commit History Analysis\n")
+        write(f"- Total Commits: {self.analysis['commit_history']['total_commits']}\n")
+        write(f"- Recent Commits (last 30 days): {self.analysis['commit_history']['recent_commits']}\n")
+        write(f"- Top Contributors: {', '.join(self.analysis['commit_history']['top_contributors'])}\n")
         if self.analysis['commit_history']['commit_frequency']:
-            md += f"- Commit Frequency: {self.analysis['commit_history']['commit_frequency']:.2f} commits per day\n\n"
+            write(f"- Commit Frequency: {self.analysis['commit_history']['commit_frequency']:.2f} commits per day\n\n")
         
-        md += f"## Dependency Analysis\n"
-        md += f"- Dependency Files Found: {', '.join(self.analysis['dependency_analysis']['dependency_files'])}\n"
+        write(f"## Dependency Analysis\n")
+        write(f"- Dependency Files Found: {', '.join(self.analysis['dependency_analysis']['dependency_files'])}\n")
         if self.analysis['dependency_analysis']['dependencies']:
-            md += f"- Dependencies:\n"
+            write(f"- Dependencies:\n")
             for dep in self.analysis['dependency_analysis']['dependencies'][:10]:  # Limit to first 10 for brevity
-                md += f"  - {dep}\n"
+                write(f"  - {dep}\n")
             if len(self.analysis['dependency_analysis']['dependencies']) > 10:
-                md += f"  - ... and {len(self.analysis['dependency_analysis']['dependencies']) - 10} more\n"
+                write(f"  - ... and {len(self.analysis['dependency_analysis']['dependencies']) - 10} more\n")
         else:
-            md += f"- No dependencies found or unable to parse dependency files.\n"
+            write(f"- No dependencies found or unable to parse dependency files.\n")
         
-        md += "\n"
+        write("\n")
         
-        md += f"## Code Complexity Analysis\n"
-        md += f"- Total Lines of Code: {self.analysis['code_complexity']['total_lines']}\n"
-        md += f"- Total Functions: {self.analysis['code_complexity']['total_functions']}\n"
-        md += f"- Average Function Complexity: {self.analysis['code_complexity']['avg_function_complexity']:.2f}\n"
-        md += f"- Files Analyzed: {self.analysis['code_complexity']['files_analyzed']}\n\n"
+        write(f"## Code Complexity Analysis\n")
+        write(f"- Total Lines of Code: {self.analysis['code_complexity']['total_lines']}\n")
+        write(f"- Total Functions: {self.analysis['code_complexity']['total_functions']}\n")
+        write(f"- Average Function Complexity: {self.analysis['code_complexity']['avg_function_complexity']:.2f}\n")
+        write(f"- Files Analyzed: {self.analysis['code_complexity']['files_analyzed']}\n\n")
 
-        md += f"## Issue Templates Analysis\n"
+        write(f"## Issue Templates Analysis\n")
         if self.analysis['issue_templates']:
-            md += "The following issue templates were found:\n"
+            write("The following issue templates were found:\n")
             for template_name, template_content in self.analysis['issue_templates'].items():
-                md += f"- {template_name}\n"
-                md += "  Sections:\n"
+                write(f"- {template_name}\n")
+                write("  Sections:\n")
                 for section_name in template_content.keys():
-                    md += f"  - {section_name}\n"
+                    write(f"  - {section_name}\n")
         else:
-            md += "No issue templates were found in this repository.\n"
-        md += "\n"
-
-        return md
\ No newline at end of file
+            write("No issue templates were found in this repository.\n")
+        write("\n")
\ No newline at end of file
@@ -1,9 +1,32 @@
 # utils.py
 import re
 
+# Compiled section patterns, keyed by section name or by the sections mapping
+_SECTION_PATTERNS = {}
+
 def extract_section(content, section_name):
-    pattern = re.compile(rf"#+\s*{section_name}.*?\n(.*?)(?:\n#+\s|\Z)", re.IGNORECASE | re.DOTALL)
+    pattern = _SECTION_PATTERNS.get(section_name)
+    if pattern is None:
+        pattern = _SECTION_PATTERNS[section_name] = re.compile(rf"#+\s*(?:{section_name}).*?\n(.*?)(?=\n#+\s|\Z)", re.IGNORECASE | re.DOTALL)
     match = pattern.search(content)
     if match:
         return match.group(1).strip()
-    return ""
\ No newline at end of file
+    return ""
+
+def extract_sections(content, sections):
+    # sections maps each result key to its heading alternatives; one scan finds them all
+    cache_key = tuple(sections.items())
+    pattern = _SECTION_PATTERNS.get(cache_key)
+    if pattern is None:
+        alternatives = "|".join(f"(?P<s{i}>{names})" for i, names in enumerate(sections.values()))
+        pattern = _SECTION_PATTERNS[cache_key] = re.compile(rf"#+\s*(?:{alternatives}).*?\n(?P<body>.*?)(?=\n#+\s|\Z)", re.IGNORECASE | re.DOTALL)
+    found = dict.fromkeys(sections, "")
+    pending = dict(enumerate(sections))
+    for match in pattern.finditer(content):
+        for i, key in list(pending.items()):
+            if match.group(f"s{i}") is not None:
+                found[key] = match.group("body").strip()
+                del pending[i]
+        if not pending:
+            break
+    return found
\ No newline at end of file